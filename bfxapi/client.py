@@ -3,8 +3,13 @@ from typing import List, Literal, Optional
 from .rest import BfxRestInterface
 from .websocket import BfxWebSocketClient
 from .urls import REST_HOST, WSS_HOST
+from .websocket.pipeline import Pipeline
+from .websocket.recovery import RateLimiter
+from .websocket.balancer import LoadBalancer
+from .utils.json_decoder import JSONBackend
 
 class Client:
+    #pylint: disable-next=too-many-locals
     def __init__(
             self,
             api_key: Optional[str] = None,
@@ -15,7 +20,16 @@ class Client:
             wss_host: str = WSS_HOST,
             wss_timeout: Optional[float] = 60 * 15,
             log_filename: Optional[str] = None,
-            log_level: Literal["ERROR", "WARNING", "INFO", "DEBUG"] = "INFO"
+            log_level: Literal["ERROR", "WARNING", "INFO", "DEBUG"] = "INFO",
+            wss_flags: int = 0,
+            wss_resubscribe_on_gap: bool = False,
+            wss_pipeline: Optional[Pipeline] = None,
+            wss_limiter: Optional[RateLimiter] = None,
+            wss_watchdog: Optional[float] = None,
+            wss_balancer: Optional[LoadBalancer] = None,
+            compact: bool = False,
+            lazy: bool = False,
+            json_backend: JSONBackend = "json"
     ):
         credentials = None
 
@@ -24,7 +38,10 @@ class Client:
 
         self.rest = BfxRestInterface(
             host=rest_host,
-            credentials=credentials
+            credentials=credentials,
+            compact=compact,
+            lazy=lazy,
+            json_backend=json_backend
         )
 
         self.wss = BfxWebSocketClient(
@@ -32,6 +49,15 @@ class Client:
             credentials=credentials,
             wss_timeout=wss_timeout,
             log_filename=log_filename,
-            log_level=log_level
+            log_level=log_level,
+            flags=wss_flags,
+            resubscribe_on_gap=wss_resubscribe_on_gap,
+            pipeline=wss_pipeline,
+            limiter=wss_limiter,
+            watchdog=wss_watchdog,
+            balancer=wss_balancer,
+            compact=compact,
+            lazy=lazy,
+            json_backend=json_backend
         )
         
\ No newline at end of file
@@ -5,9 +5,11 @@ from .rest_merchant_endpoints import RestMerchantEndpoints
 class BfxRestInterface:
     VERSION = 2
 
-    def __init__(self, host, credentials = None):
+    def __init__(self, host, credentials = None, *, compact = False, lazy = False, json_backend = 'json'):
         api_key, api_secret = (credentials['api_key'], credentials['api_secret']) if credentials else (None, None)
 
-        self.public = RestPublicEndpoints(host=host)
-        self.auth = RestAuthenticatedEndpoints(host=host, api_key=api_key, api_secret=api_secret)
-        self.merchant = RestMerchantEndpoints(host=host, api_key=api_key, api_secret=api_secret)
+        self.public = RestPublicEndpoints(host=host, compact=compact, lazy=lazy, json_backend=json_backend)
+        self.auth = RestAuthenticatedEndpoints(host=host, api_key=api_key, api_secret=api_secret, \
+            lazy=lazy, json_backend=json_backend)
+        self.merchant = RestMerchantEndpoints(host=host, api_key=api_key, api_secret=api_secret, \
+            json_backend=json_backend)
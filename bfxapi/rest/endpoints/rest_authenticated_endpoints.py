@@ -1,4 +1,4 @@
-from typing import Dict, List, Tuple, Union, Literal, Optional
+from typing import Dict, List, Tuple, Union, Literal, Optional, Any
 from decimal import Decimal
 from datetime import datetime
 
@@ -58,8 +58,7 @@ class RestAuthenticatedEndpoints(Middleware):
             endpoint = "auth/r/orders"
         else: endpoint = f"auth/r/orders/{symbol}"
 
-        return [ serializers.Order.parse(*sub_data) \
-            for sub_data in self._post(endpoint, body={ "id": ids }) ]
+        return self._parse_many(serializers.Order, self._post(endpoint, body={ "id": ids }))
 
     def submit_order(self,
                      type: OrderType,
@@ -150,8 +149,7 @@ class RestAuthenticatedEndpoints(Middleware):
             "limit": limit 
         }
 
-        return [ serializers.Order.parse(*sub_data) \
-            for sub_data in self._post(endpoint, body=body) ]
+        return self._parse_many(serializers.Order, self._post(endpoint, body=body))
 
     def get_order_trades(self,
                          symbol: str,
@@ -165,7 +163,8 @@ class RestAuthenticatedEndpoints(Middleware):
                            sort: Optional[Sort] = None,
                            start: Optional[str] = None,
                            end: Optional[str] = None,
-                           limit: Optional[int] = None) -> List[Trade]:
+                           limit: Optional[int] = None,
+                           as_array: bool = False) -> Union[List[Trade], Any]:
         if symbol is None:
             endpoint = "auth/r/trades/hist"
         else: endpoint = f"auth/r/trades/{symbol}/hist"
@@ -175,8 +174,10 @@ class RestAuthenticatedEndpoints(Middleware):
             "limit": limit
         }
 
-        return [ serializers.Trade.parse(*sub_data) \
-            for sub_data in self._post(endpoint, body=body) ]
+        if as_array:
+            return serializers.Trade.parse_array(self._post(endpoint, body=body))
+
+        return serializers.Trade.parse_many(self._post(endpoint, body=body))
 
     def get_ledgers(self,
                     currency: str,
@@ -184,14 +185,17 @@ class RestAuthenticatedEndpoints(Middleware):
                     category: Optional[int] = None,
                     start: Optional[str] = None,
                     end: Optional[str] = None,
-                    limit: Optional[int] = None) -> List[Ledger]:
+                    limit: Optional[int] = None,
+                    as_array: bool = False) -> Union[List[Ledger], Any]:
         body = {
             "category": category, "start": start, "end": end, 
             "limit": limit 
         }
 
-        return [ serializers.Ledger.parse(*sub_data) \
-            for sub_data in self._post(f"auth/r/ledgers/{currency}/hist", body=body) ]
+        if as_array:
+            return serializers.Ledger.parse_array(self._post(f"auth/r/ledgers/{currency}/hist", body=body))
+
+        return serializers.Ledger.parse_many(self._post(f"auth/r/ledgers/{currency}/hist", body=body))
 
     def get_base_margin_info(self) -> BaseMarginInfo:
         return serializers.BaseMarginInfo \
@@ -206,8 +210,7 @@ class RestAuthenticatedEndpoints(Middleware):
             for sub_data in self._post("auth/r/info/margin/sym_all") ]
 
     def get_positions(self) -> List[Position]:
-        return [ serializers.Position.parse(*sub_data) \
-            for sub_data in self._post("auth/r/positions") ]
+        return self._parse_many(serializers.Position, self._post("auth/r/positions"))
 
     def claim_position(self,
                        id: int,
@@ -27,7 +27,10 @@ class RestPublicEndpoints(Middleware):
     def get_tickers(self, symbols: List[str]) -> Dict[str, Union[TradingPairTicker, FundingCurrencyTicker]]:
         data = self._get("tickers", params={ "symbols": ",".join(symbols) })
 
-        parsers = { "t": serializers.TradingPairTicker.parse, "f": serializers.FundingCurrencyTicker.parse }
+        parsers = {
+            "t": self._serializer(serializers.TradingPairTicker).parse,
+            "f": self._serializer(serializers.FundingCurrencyTicker).parse
+        }
 
         return {
             symbol: cast(Union[TradingPairTicker, FundingCurrencyTicker],
@@ -60,10 +63,10 @@ class RestPublicEndpoints(Middleware):
         return cast(Dict[str, FundingCurrencyTicker], data)
 
     def get_t_ticker(self, symbol: str) -> TradingPairTicker:
-        return serializers.TradingPairTicker.parse(*self._get(f"ticker/{symbol}"))
+        return self._serializer(serializers.TradingPairTicker).parse(*self._get(f"ticker/{symbol}"))
 
     def get_f_ticker(self, symbol: str) -> FundingCurrencyTicker:
-        return serializers.FundingCurrencyTicker.parse(*self._get(f"ticker/{symbol}"))
+        return self._serializer(serializers.FundingCurrencyTicker).parse(*self._get(f"ticker/{symbol}"))
 
     def get_tickers_history(self,
                             symbols: List[str],
@@ -83,10 +86,13 @@ class RestPublicEndpoints(Middleware):
                      limit: Optional[int] = None,
                      start: Optional[str] = None,
                      end: Optional[str] = None,
-                     sort: Optional[Sort] = None) -> List[TradingPairTrade]:
+                     sort: Optional[Sort] = None,
+                     as_array: bool = False) -> Union[List[TradingPairTrade], Any]:
         params = { "limit": limit, "start": start, "end": end, "sort": sort }
         data = self._get(f"trades/{pair}/hist", params=params)
-        return [ serializers.TradingPairTrade.parse(*sub_data) for sub_data in data ]
+        if as_array:
+            return serializers.TradingPairTrade.parse_array(data)
+        return self._serializer(serializers.TradingPairTrade).parse_many(data)
 
     def get_f_trades(self,
                      currency: str,
@@ -94,40 +100,43 @@ class RestPublicEndpoints(Middleware):
                      limit: Optional[int] = None,
                      start: Optional[str] = None,
                      end: Optional[str] = None,
-                     sort: Optional[Sort] = None) -> List[FundingCurrencyTrade]:
+                     sort: Optional[Sort] = None,
+                     as_array: bool = False) -> Union[List[FundingCurrencyTrade], Any]:
         params = { "limit": limit, "start": start, "end": end, "sort": sort }
         data = self._get(f"trades/{currency}/hist", params=params)
-        return [ serializers.FundingCurrencyTrade.parse(*sub_data) for sub_data in data ]
+        if as_array:
+            return serializers.FundingCurrencyTrade.parse_array(data)
+        return self._serializer(serializers.FundingCurrencyTrade).parse_many(data)
 
     def get_t_book(self,
                    pair: str,
                    precision: Literal["P0", "P1", "P2", "P3", "P4"],
                    *,
                    len: Optional[Literal[1, 25, 100]] = None) -> List[TradingPairBook]:
-        return [ serializers.TradingPairBook.parse(*sub_data) \
-            for sub_data in self._get(f"book/{pair}/{precision}", params={ "len": len }) ]
+        return self._serializer(serializers.TradingPairBook) \
+            .parse_many(self._get(f"book/{pair}/{precision}", params={ "len": len }))
 
     def get_f_book(self,
                    currency: str,
                    precision: Literal["P0", "P1", "P2", "P3", "P4"],
                    *,
                    len: Optional[Literal[1, 25, 100]] = None) -> List[FundingCurrencyBook]:
-        return [ serializers.FundingCurrencyBook.parse(*sub_data) \
-            for sub_data in self._get(f"book/{currency}/{precision}", params={ "len": len }) ]
+        return self._serializer(serializers.FundingCurrencyBook) \
+            .parse_many(self._get(f"book/{currency}/{precision}", params={ "len": len }))
 
     def get_t_raw_book(self,
                        pair: str,
                        *,
                        len: Optional[Literal[1, 25, 100]] = None) -> List[TradingPairRawBook]:
-        return [ serializers.TradingPairRawBook.parse(*sub_data) \
-            for sub_data in self._get(f"book/{pair}/R0", params={ "len": len }) ]
+        return self._serializer(serializers.TradingPairRawBook) \
+            .parse_many(self._get(f"book/{pair}/R0", params={ "len": len }))
 
     def get_f_raw_book(self,
                        currency: str,
                        *,
                        len: Optional[Literal[1, 25, 100]] = None) -> List[FundingCurrencyRawBook]:
-        return [ serializers.FundingCurrencyRawBook.parse(*sub_data) \
-            for sub_data in self._get(f"book/{currency}/R0", params={ "len": len }) ]
+        return self._serializer(serializers.FundingCurrencyRawBook) \
+            .parse_many(self._get(f"book/{currency}/R0", params={ "len": len }))
 
     def get_stats_hist(self,
                        resource: str,
@@ -135,10 +144,13 @@ class RestPublicEndpoints(Middleware):
                        sort: Optional[Sort] = None,
                        start: Optional[str] = None,
                        end: Optional[str] = None,
-                       limit: Optional[int] = None) -> List[Statistic]:
+                       limit: Optional[int] = None,
+                       as_array: bool = False) -> Union[List[Statistic], Any]:
         params = { "sort": sort, "start": start, "end": end, "limit": limit }
         data = self._get(f"stats1/{resource}/hist", params=params)
-        return [ serializers.Statistic.parse(*sub_data) for sub_data in data ]
+        if as_array:
+            return serializers.Statistic.parse_array(data)
+        return serializers.Statistic.parse_many(data)
 
     def get_stats_last(self,
                        resource: str,
@@ -158,10 +170,13 @@ class RestPublicEndpoints(Middleware):
                          sort: Optional[Sort] = None,
                          start: Optional[str] = None,
                          end: Optional[str] = None,
-                         limit: Optional[int] = None) -> List[Candle]:
+                         limit: Optional[int] = None,
+                         as_array: bool = False) -> Union[List[Candle], Any]:
         params = { "sort": sort, "start": start, "end": end, "limit": limit }
         data = self._get(f"candles/trade:{tf}:{symbol}/hist", params=params)
-        return [ serializers.Candle.parse(*sub_data) for sub_data in data ]
+        if as_array:
+            return serializers.Candle.parse_array(data)
+        return self._serializer(serializers.Candle).parse_many(data)
 
     def get_candles_last(self,
                          symbol: str,
@@ -173,7 +188,7 @@ class RestPublicEndpoints(Middleware):
                          limit: Optional[int] = None) -> Candle:
         params = { "sort": sort, "start": start, "end": end, "limit": limit }
         data = self._get(f"candles/trade:{tf}:{symbol}/last", params=params)
-        return serializers.Candle.parse(*data)
+        return self._serializer(serializers.Candle).parse(*data)
 
     def get_derivatives_status(self, keys: Union[List[str], Literal["ALL"]]) -> Dict[str, DerivativesStatus]:
         if keys == "ALL":
@@ -194,10 +209,13 @@ class RestPublicEndpoints(Middleware):
                                        sort: Optional[Sort] = None,
                                        start: Optional[str] = None,
                                        end: Optional[str] = None,
-                                       limit: Optional[int] = None) -> List[DerivativesStatus]:
+                                       limit: Optional[int] = None,
+                                       as_array: bool = False) -> Union[List[DerivativesStatus], Any]:
         params = { "sort": sort, "start": start, "end": end, "limit": limit }
         data = self._get(f"status/deriv/{key}/hist", params=params)
-        return [ serializers.DerivativesStatus.parse(*sub_data) for sub_data in data ]
+        if as_array:
+            return serializers.DerivativesStatus.parse_array(data)
+        return serializers.DerivativesStatus.parse_many(data)
 
     def get_liquidations(self,
                          *,
@@ -219,7 +237,7 @@ class RestPublicEndpoints(Middleware):
                          limit: Optional[int] = None) -> List[Candle]:
         params = {"sort": sort, "start": start, "end": end, "limit": limit}
         data = self._get(f"candles/trade:{tf}:{symbol}/hist", params=params)
-        return [ serializers.Candle.parse(*sub_data) for sub_data in data ]
+        return self._serializer(serializers.Candle).parse_many(data)
 
     def get_leaderboards_hist(self,
                               resource: str,
@@ -230,7 +248,7 @@ class RestPublicEndpoints(Middleware):
                               limit: Optional[int] = None) -> List[Leaderboard]:
         params = { "sort": sort, "start": start, "end": end, "limit": limit }
         data = self._get(f"rankings/{resource}/hist", params=params)
-        return [ serializers.Leaderboard.parse(*sub_data) for sub_data in data ]
+        return serializers.Leaderboard.parse_many(data)
 
     def get_leaderboards_last(self,
                               resource: str,
@@ -251,7 +269,7 @@ class RestPublicEndpoints(Middleware):
                           limit: Optional[int] = None) -> List[FundingStatistic]:
         params = { "start": start, "end": end, "limit": limit }
         data = self._get(f"funding/stats/{symbol}/hist", params=params)
-        return [ serializers.FundingStatistic.parse(*sub_data) for sub_data in data ]
+        return serializers.FundingStatistic.parse_many(data)
 
     def get_pulse_profile_details(self, nickname: str) -> PulseProfile:
         return serializers.PulseProfile.parse(*self._get(f"pulse/profile/{nickname}"))
@@ -260,14 +278,12 @@ class RestPublicEndpoints(Middleware):
                                   *,
                                   end: Optional[str] = None,
                                   limit: Optional[int] = None) -> List[PulseMessage]:
-        messages = []
+        data = self._get("pulse/hist", params={ "end": end, "limit": limit })
 
-        for subdata in self._get("pulse/hist", params={ "end": end, "limit": limit }):
+        for subdata in data:
             subdata[18] = subdata[18][0]
-            message = serializers.PulseMessage.parse(*subdata)
-            messages.append(message)
 
-        return messages
+        return self._parse_many(serializers.PulseMessage, data)
 
     def get_trading_market_average_price(self,
                                          symbol: str,
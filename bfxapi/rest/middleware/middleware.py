@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Optional, Any
+from typing import TYPE_CHECKING, TypeVar, Sequence, List, Optional, Any
 
 from http import HTTPStatus
 
@@ -6,17 +6,33 @@ import time, hmac, hashlib, json, requests
 
 from ..enums import Error
 from ..exceptions import ResourceNotFound, RequestParametersError, InvalidAuthenticationCredentials, UnknownGenericError
+from ...types.labeler import _Type, _Serializer
 from ...utils.json_encoder import JSONEncoder
+from ...utils.json_decoder import JSONBackend, get_json_loads
 
 if TYPE_CHECKING:
     from requests.sessions import _Params
 
+T = TypeVar("T", bound=_Type)
+
 class Middleware:
     TIMEOUT = 30
 
-    def __init__(self, host: str, api_key: Optional[str] = None, api_secret: Optional[str] = None):
+    def __init__(self, host: str, api_key: Optional[str] = None, api_secret: Optional[str] = None,
+                 *, compact: bool = False, lazy: bool = False, json_backend: JSONBackend = "json"):
         self.host, self.api_key, self.api_secret = host, api_key, api_secret
 
+        self.compact, self.lazy, self.__loads = compact, lazy, get_json_loads(json_backend)
+
+    def _serializer(self, serializer: _Serializer[T]) -> _Serializer[T]:
+        return self.compact and serializer.compact or serializer
+
+    def _parse_many(self, serializer: _Serializer[T], rows: Sequence[Sequence[Any]]) -> List[T]:
+        if self.lazy:
+            return [ serializer.parse_lazy(*row) for row in rows ]
+
+        return serializer.parse_many(rows)
+
     def __build_authentication_headers(self, endpoint: str, data: Optional[str] = None):
         assert isinstance(self.api_key, str) and isinstance(self.api_secret, str), \
             "API_KEY and API_SECRET must be both str to call __build_authentication_headers"
@@ -49,7 +65,7 @@ class Middleware:
         if response.status_code == HTTPStatus.NOT_FOUND:
             raise ResourceNotFound(f"No resources found at endpoint <{endpoint}>.")
 
-        data = response.json()
+        data = self.__loads(response.content)
 
         if len(data) and data[0] == "error":
             if data[1] == Error.ERR_PARAMS:
@@ -82,7 +98,7 @@ class Middleware:
         if response.status_code == HTTPStatus.NOT_FOUND:
             raise ResourceNotFound(f"No resources found at endpoint <{endpoint}>.")
 
-        data = response.json()
+        data = self.__loads(response.content)
 
         if isinstance(data, list) and len(data) and data[0] == "error":
             if data[1] == Error.ERR_PARAMS:
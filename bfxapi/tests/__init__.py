@@ -3,12 +3,30 @@ import unittest
 from .test_types_labeler import TestTypesLabeler
 from .test_types_notification import TestTypesNotification
 from .test_types_serializers import TestTypesSerializers
+from .test_websocket_latency import TestWebSocketLatency
+from .test_websocket_order_book import TestWebSocketOrderBook
+from .test_websocket_pipeline import TestWebSocketPipeline
+from .test_websocket_ring_buffer import TestWebSocketRingBuffer
+from .test_websocket_recovery import TestWebSocketRecovery
+from .test_websocket_balancer import TestWebSocketBalancer
+from .test_websocket_registry import TestWebSocketRegistry
+from .test_websocket_bucket import TestWebSocketBucket
+from .test_websocket_handlers import TestWebSocketHandlers
 
 def suite():
     return unittest.TestSuite([
         unittest.makeSuite(TestTypesLabeler),
         unittest.makeSuite(TestTypesNotification),
         unittest.makeSuite(TestTypesSerializers),
+        unittest.makeSuite(TestWebSocketLatency),
+        unittest.makeSuite(TestWebSocketOrderBook),
+        unittest.makeSuite(TestWebSocketPipeline),
+        unittest.makeSuite(TestWebSocketRingBuffer),
+        unittest.makeSuite(TestWebSocketRecovery),
+        unittest.makeSuite(TestWebSocketBalancer),
+        unittest.makeSuite(TestWebSocketRegistry),
+        unittest.makeSuite(TestWebSocketBucket),
+        unittest.makeSuite(TestWebSocketHandlers),
     ])
 
 if __name__ == "__main__":
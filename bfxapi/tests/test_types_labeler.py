@@ -4,7 +4,12 @@ from typing import Optional
 
 from dataclasses import dataclass
 
-from ..types.labeler import _Type, generate_labeler_serializer, generate_recursive_serializer
+from ..types.labeler import _Type, compact, compose, generate_labeler_serializer, generate_recursive_serializer
+
+try:
+    import numpy #type: ignore
+except ImportError:
+    numpy = None #type: ignore
 
 class TestTypesLabeler(unittest.TestCase):
     def test_generate_labeler_serializer(self):
@@ -29,6 +34,65 @@ class TestTypesLabeler(unittest.TestCase):
                         "fewer arguments than the serializer labels."):
             serializer.parse(5, 65.0, "X")
 
+    def test_generate_labeler_serializer_parse_many(self):
+        @dataclass
+        class Test(_Type):
+            A: int
+            B: float
+
+        serializer = generate_labeler_serializer("Test", Test, [ "A", "_PLACEHOLDER", "B" ])
+
+        rows = [ [ 5, None, 65.0 ], [ 6, None, 66.0 ] ]
+
+        self.assertListEqual(serializer.parse_many(rows), [ Test(5, 65.0), Test(6, 66.0) ],
+            msg="_Serializer::parse_many should produce the same results of _Serializer::parse.")
+
+        self.assertListEqual([ list(column) for column in serializer.parse_many(rows, columnar=True).values() ],
+            [ [ 5, 6 ], [ 65.0, 66.0 ] ], msg="_Serializer::parse_many should produce the right columns.")
+
+        with self.assertRaises(AssertionError,
+                msg="_Serializer::parse_many should raise an AssertionError if any row " \
+                        "contains fewer elements than the serializer labels."):
+            serializer.parse_many([ [ 5, None, 65.0 ], [ 6, 66.0 ] ])
+
+    @unittest.skipIf(numpy is None, "numpy is not installed.")
+    def test_generate_labeler_serializer_parse_array(self):
+        @dataclass
+        class Test(_Type):
+            A: int
+            B: float
+            C: Optional[int]
+
+        serializer = generate_labeler_serializer("Test", Test, [ "A", "_PLACEHOLDER", "B", "C" ])
+
+        array = serializer.parse_array([ [ 1675787861506, None, 65.0, 1 ], [ 1675787861507, None, 66, None ] ])
+
+        self.assertListEqual([ str(array[label].dtype) for label in "ABC" ], [ "int64", "float64", "object" ],
+            msg="_Serializer::parse_array should derive the dtype of each field from the dataclass annotations.")
+
+        self.assertListEqual(array["A"].tolist(), [ 1675787861506, 1675787861507 ],
+            msg="_Serializer::parse_array should produce the right structured array.")
+
+    def test_generate_flat_labeler_serializer(self):
+        @dataclass
+        class Test(_Type):
+            A: int
+            B: float
+            C: str
+
+        serializer = generate_labeler_serializer("Test", Test, [ "A", "_PLACEHOLDER", "B", "C" ], flat=True)
+
+        self.assertEqual(serializer.parse(5, [ None, [ [ 65.0 ] ], "X" ]), Test(5, 65.0, "X"),
+            msg="_Serializer should flatten nested arguments when flat=True.")
+
+        nested: list = [ 65.0, "X" ]
+
+        for _ in range(10_000):
+            nested = [ nested ]
+
+        self.assertEqual(serializer.parse(5, None, nested, [ None ] * 100_000), Test(5, 65.0, "X"),
+            msg="_Serializer should flatten long and deeply nested arguments in linear time without recursion.")
+
     def test_generate_recursive_serializer(self):
         @dataclass
         class Outer(_Type):
@@ -52,5 +116,32 @@ class TestTypesLabeler(unittest.TestCase):
         self.assertEqual(outer.parse(10, 45.5, [ "Y", [ True ] ]), Outer(10, 45.5, Middle("Y", Inner(True))),
             msg="_RecursiveSerializer should produce the right result.")
 
+        lazy = outer.parse_lazy(10, 45.5, [ "Y", [ True ] ])
+
+        self.assertEqual((lazy.A, lazy.C.D, lazy.C.E.F), (10, "Y", True),
+            msg="_RecursiveSerializer::parse_lazy should decode each field (and nested record) on access.")
+
+        self.assertEqual(getattr(lazy, "materialize")(), Outer(10, 45.5, Middle("Y", Inner(True))),
+            msg="A lazy record view should materialize into the same result of _RecursiveSerializer::parse.")
+
+    def test_generate_compact_labeler_serializer(self):
+        @compose(compact, dataclass)
+        class Test(_Type):
+            A: int
+            B: float
+
+        serializer = generate_labeler_serializer("Test", Test, [ "A", "_PLACEHOLDER", "B" ])
+
+        test = serializer.compact.parse(5, None, 65.0)
+
+        self.assertIsInstance(test, getattr(Test, "Compact"),
+            msg="_Serializer::compact should produce instances of the slotted variant of the dataclass.")
+
+        self.assertFalse(hasattr(test, "__dict__"),
+            msg="The slotted variant of a dataclass should not allocate a __dict__.")
+
+        self.assertEqual((test.A, test.B), (5, 65.0),
+            msg="The slotted variant of a dataclass should keep attribute access compatible.")
+
 if __name__ == "__main__":
     unittest.main()
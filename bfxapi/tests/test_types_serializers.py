@@ -1,6 +1,6 @@
 import unittest
 from ..types import serializers
-from ..types.labeler import _Type
+from ..types.labeler import _Type, _RecursiveSerializer
 
 class TestTypesSerializers(unittest.TestCase):
     def test_types_serializers(self):
@@ -13,5 +13,17 @@ class TestTypesSerializers(unittest.TestCase):
                 f"_Serializer <{serializer.name}> and _Type <{serializer.klass.__name__}> " \
                     "must have matching labels and fields.")
 
+    def test_types_serializers_compiled_parsers(self):
+        for serializer in map(serializers.__dict__.get, serializers.__serializers__):
+            if isinstance(serializer, _RecursiveSerializer):
+                continue
+
+            values = list(range(128))
+
+            #pylint: disable-next=protected-access
+            self.assertEqual(serializer.parse(*values), serializer.klass(**dict(serializer._serialize(*values))),
+                f"_Serializer <{serializer.name}>: the compiled parser must produce the same result " \
+                    "of the generic label-based serialization.")
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+
+from pyee.asyncio import AsyncIOEventEmitter
+
+from ..websocket.balancer import LoadBalancer
+from ..websocket.client import BfxWebSocketBucket
+from ..websocket.client.bfx_websocket_workers import _RemoteBucket
+from ..websocket.registry import SubscriptionRegistry
+
+class TestWebSocketBalancer(unittest.TestCase):
+    def test_load_balancer(self):
+        balancer, buckets = LoadBalancer(interval=1.0, half_life=1.0), \
+            [ BfxWebSocketBucket("", AsyncIOEventEmitter()) for _ in range(3) ]
+
+        for index, bucket in enumerate(buckets):
+            bucket.subscriptions = { chan_id: { "subId": f"{index}-{chan_id}" } for chan_id in range(index + 1) }
+
+        buckets[0].counts = { 0: 100 }
+
+        buckets[1].counts = { 0: 10, 1: 20 }
+
+        self.assertEqual([ bucket.meter(1.0, balancer.alpha) for bucket in buckets ], [ 100.0, 30.0, 0.0 ])
+        self.assertEqual(buckets[1].rates, { "1-0": 10.0, "1-1": 20.0 })
+
+        buckets[1].counts = { 0: 20 }
+
+        buckets[1].meter(1.0, balancer.alpha)
+
+        self.assertEqual(buckets[1].rates, { "1-0": 15.0, "1-1": 10.0 })
+        self.assertEqual(balancer.choose(buckets), 2)
+
+        buckets[2].subscriptions.update({ chan_id: { "subId": f"2-{chan_id}" } \
+            for chan_id in range(3, BfxWebSocketBucket.MAXIMUM_SUBSCRIPTIONS_AMOUNT + 2) })
+
+        self.assertEqual(balancer.choose(buckets), 1)
+
+        remotes = [ _RemoteBucket(index, None, SubscriptionRegistry()) for index in range(2) ]
+
+        remotes[0].subscriptions = { "sub_id": { "subId": "sub_id" } }
+
+        self.assertEqual(balancer.choose(remotes), 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,361 @@
+import unittest, asyncio, json, queue
+
+from http import HTTPStatus
+
+from unittest.mock import patch
+
+import websockets
+
+from pyee.asyncio import AsyncIOEventEmitter
+
+from ..websocket.client import BfxWebSocketClient, BfxWebSocketBucket
+from ..websocket.enums import ConfFlag
+from ..websocket.client.bfx_websocket_bucket import _Delay
+from ..websocket.client.bfx_websocket_workers import _ForwardingEventEmitter, _ForwardingRegistry, _RemoteBucket, \
+    _CLOSED, _ERROR, BfxWebSocketWorkers
+from ..websocket.order_book import OrderBook
+from ..websocket.registry import SubscriptionRegistry
+
+class _WebSocket:
+    def __init__(self):
+        self.open, self.frames = True, [ ]
+
+    async def send(self, frame):
+        self.frames.append(json.loads(frame))
+
+class _Logger:
+    def __init__(self):
+        self.warnings, self.errors = [ ], [ ]
+
+    def info(self, _message):
+        pass
+
+    def warning(self, message):
+        self.warnings.append(message)
+
+    def error(self, message):
+        self.errors.append(message)
+
+@patch.object(_Delay, "BACKOFF_MIN", 0.01)
+@patch.object(_Delay, "BACKOFF_INITIAL", 0.01)
+class TestWebSocketBucket(unittest.TestCase):
+    def test_bucket_recovery_snapshot(self):
+        async def _test():
+            emitter, book = AsyncIOEventEmitter(), OrderBook()
+
+            emitter.on("t_book_snapshot", lambda _, snapshot: book.snapshot(snapshot))
+            emitter.on("t_book_update", lambda _, data: book.update(data))
+
+            bucket = BfxWebSocketBucket("", emitter)
+
+            #pylint: disable-next=protected-access
+            dispatch = bucket._BfxWebSocketBucket__dispatch
+
+            subscribed = { "event": "subscribed", "channel": "book", "symbol": "tBTCUSD", "prec": "P0",
+                "freq": "F0", "len": "25", "subId": "book" }
+
+            await dispatch({ **subscribed, "chanId": 1 }, None, None, None)
+            await dispatch([ 1, [ [ 100.0, 1, 1.0 ], [ 101.0, 1, -1.0 ] ] ], None, None, None)
+
+            bucket.websocket = _WebSocket()
+
+            #pylint: disable-next=protected-access
+            await bucket._BfxWebSocketBucket__recover_state()
+
+            self.assertEqual([ frame["subId"] for frame in bucket.websocket.frames ], [ "book" ])
+
+            await dispatch({ **subscribed, "chanId": 2 }, None, None, None)
+            await dispatch([ 2, [ [ 200.0, 1, 1.0 ], [ 201.0, 1, -1.0 ] ] ], None, None, None)
+
+            self.assertEqual((book.best_bid().price, book.best_ask().price), (200.0, 201.0))
+            self.assertEqual((len(book.bids), len(book.asks)), (1, 1))
+
+        asyncio.run(_test())
+
+    def test_bucket_classify(self):
+        async def _test():
+            bucket = BfxWebSocketBucket("", AsyncIOEventEmitter())
+
+            #pylint: disable-next=protected-access
+            dispatch, classify = bucket._BfxWebSocketBucket__dispatch, bucket._BfxWebSocketBucket__classify
+
+            for chan_id, channel, extra in ((1, "book", { "prec": "P0", "freq": "F0", "len": "25" }),
+                    (2, "trades", { }), (3, "candles", { "key": "trade:1m:tBTCUSD" })):
+                await dispatch({ "event": "subscribed", "channel": channel, "chanId": chan_id, "subId": channel,
+                    "symbol": "tBTCUSD", **extra }, None, None, None)
+
+            self.assertEqual([ classify(message) for message in (
+                { "event": "info" }, [ 1, [ [ 100.0, 1, 1.0 ] ] ], [ 1, [ 100.0, 1, 1.0 ] ], [ 1, "cs", 123 ],
+                [ 2, [ [ 1, 2, 3.0, 4.0 ] ] ], [ 2, "te", [ 1, 2, 3.0, 4.0 ] ], [ 3, [ ] ], [ 3, [ 1, 2, 3, 4, 5, 6 ] ]
+            ) ], [
+                (False, None, None), (False, None, 1), (True, (1, 100.0), 1), (False, None, 1),
+                (False, None, 2), (True, None, 2), (False, None, 3), (True, (3, ), 3)
+            ])
+
+        asyncio.run(_test())
+
+    def test_bucket_rejected_subscription(self):
+        async def _test():
+            events, registry = queue.Queue(), SubscriptionRegistry()
+
+            remote = _RemoteBucket(0, queue.Queue(), registry)
+
+            bucket = BfxWebSocketBucket("", _ForwardingEventEmitter(events, 0), registry=_ForwardingRegistry())
+
+            bucket.websocket = _WebSocket()
+
+            await remote.subscribe("ticker", sub_id="ticker", symbol="tFOO")
+            await bucket.subscribe("ticker", sub_id="ticker", symbol="tFOO")
+
+            #pylint: disable-next=protected-access
+            await bucket._BfxWebSocketBucket__dispatch({ "event": "error", "msg": "subscribe: invalid",
+                "code": 10300, "channel": "ticker", "symbol": "tFOO", "subId": "ticker" }, None, None, None)
+
+            await asyncio.sleep(0)
+
+            for event, args in events.get_nowait()[1]:
+                remote.receive(event, args)
+
+            self.assertEqual((remote.pendings, bucket.pendings), ({ }, { }))
+            self.assertIsNone(registry.find(SubscriptionRegistry.key("ticker", symbol="tFOO")))
+            self.assertIsNone(registry.get_bucket("ticker"))
+
+        asyncio.run(_test())
+
+    def test_bucket_worker_unsubscribe_before_subscribed(self):
+        async def _test():
+            commands, registry = queue.Queue(), SubscriptionRegistry()
+
+            remote = _RemoteBucket(0, commands, registry)
+
+            await remote.subscribe("ticker", sub_id="ticker", symbol="tBTCUSD")
+
+            registry.release("ticker")
+
+            remote.receive("subscribed", ({ "event": "subscribed", "channel": "ticker", "subId": "ticker" }, ))
+
+            self.assertEqual([ commands.get_nowait()[0] for _ in range(commands.qsize()) ],
+                [ "subscribe", "unsubscribe" ])
+            self.assertEqual((remote.pendings, remote.subscriptions, len(registry)), ({ }, { }, 0))
+
+        asyncio.run(_test())
+
+    def test_bucket_worker_error(self):
+        emitter, logger = AsyncIOEventEmitter(), _Logger()
+
+        workers = BfxWebSocketWorkers("", emitter, connections=1, processes=1, registry=SubscriptionRegistry(),
+            logger=logger)
+
+        emitter.on("__error", lambda *args: self.fail("unexpected event"))
+
+        #pylint: disable-next=protected-access
+        workers._BfxWebSocketWorkers__receive(0, [ (_ERROR, ("Traceback ...\nValueError\n", )), (_CLOSED, ()) ])
+
+        self.assertEqual(logger.errors, [ "Bucket no.0 stopped on an unexpected error:\nTraceback ...\nValueError" ])
+
+    def test_bucket_decode_bookkeeping(self):
+        bucket = BfxWebSocketBucket("", AsyncIOEventEmitter())
+
+        #pylint: disable-next=protected-access
+        decode = bucket._BfxWebSocketBucket__decode
+
+        self.assertEqual(decode('[1,"cs",-123]')[0], [ 1, "cs", -123 ])
+        self.assertIsNone(decode('[1,"hb"]'))
+        self.assertEqual((bucket.last_seen, bucket.counts), ({ }, { }))
+
+        bucket = BfxWebSocketBucket("", AsyncIOEventEmitter(), watchdog=5.0, metering=True)
+
+        #pylint: disable-next=protected-access
+        decode = bucket._BfxWebSocketBucket__decode
+
+        decode("[1,[100.0,1,1.0]]")
+        decode('[2,"hb"]')
+
+        self.assertEqual((set(bucket.last_seen), bucket.counts), ({ 1, 2 }, { 1: 1 }))
+
+    def test_bucket_trailing_fields(self):
+        emitter, gaps = AsyncIOEventEmitter(), [ ]
+
+        emitter.on("sequence_gap", lambda expected, received: gaps.append((expected, received)))
+
+        bucket = BfxWebSocketBucket("", emitter, flags=ConfFlag.TIMESTAMP)
+
+        #pylint: disable-next=protected-access
+        decode = bucket._BfxWebSocketBucket__decode
+
+        self.assertIsNone(decode('[1,"hb"]', 0.0))
+        self.assertIsNone(decode('[1,"hb",1700000000000]', 0.0))
+        self.assertIsNone(decode("[1]", 0.0))
+        self.assertEqual(decode('[1,"cs",-123]', 0.0)[:2], ([ 1, "cs", -123 ], None))
+        self.assertEqual(decode('[1,"cs",-123,1700000000000]', 0.0)[:2], ([ 1, "cs", -123 ], 1700000000000))
+        self.assertEqual(decode("[1,[100.0,1,1.0]]", 0.0)[:2], ([ 1, [ 100.0, 1, 1.0 ] ], None))
+
+        bucket = BfxWebSocketBucket("", emitter, flags=ConfFlag.SEQ_ALL | ConfFlag.TIMESTAMP)
+
+        #pylint: disable-next=protected-access
+        decode = bucket._BfxWebSocketBucket__decode
+
+        self.assertIsNone(decode('[1,"hb"]', 0.0))
+        self.assertIsNone(decode('[1,"hb",7]', 0.0))
+        self.assertIsNone(decode('[1,"hb",8,1700000000000]', 0.0))
+        self.assertEqual(decode('[1,"te",[1,2,3.0,4.0],9,1700000000000]', 0.0)[:2],
+            ([ 1, "te", [ 1, 2, 3.0, 4.0 ] ], 1700000000000))
+        self.assertEqual((bucket.sequence, gaps), (9, [ ]))
+
+    def test_bucket_unsubscribe_during_resubscription(self):
+        async def _test():
+            wss = BfxWebSocketClient("", None)
+
+            bucket = BfxWebSocketBucket("", wss.event_emitter, registry=wss.registry)
+
+            bucket.websocket, wss.buckets = _WebSocket(), [ bucket ]
+
+            #pylint: disable-next=protected-access
+            dispatch = bucket._BfxWebSocketBucket__dispatch
+
+            async def _subscribed(chan_id):
+                await dispatch({ "event": "subscribed", "channel": "ticker", "chanId": chan_id, "subId": sub_id,
+                    "symbol": "tBTCUSD" }, None, None, None)
+
+            async def _unsubscribed(chan_id):
+                await dispatch({ "event": "unsubscribed", "status": "OK", "chanId": chan_id }, None, None, None)
+
+            def _events():
+                return [ frame["event"] for frame in bucket.websocket.frames ]
+
+            sub_id = await wss.subscribe("ticker", symbol="tBTCUSD")
+
+            await _subscribed(1)
+            await bucket.resubscribe(1)
+            await wss.unsubscribe(sub_id)
+            await _unsubscribed(1)
+
+            self.assertEqual(_events(), [ "subscribe", "unsubscribe" ])
+            self.assertEqual((bucket.subscriptions, bucket.pendings, bucket.resubscriptions), ({ }, { }, { }))
+            self.assertEqual((len(wss.registry), wss.registry.find(SubscriptionRegistry.key("ticker",
+                symbol="tBTCUSD"))), (0, None))
+
+            sub_id = await wss.subscribe("ticker", symbol="tBTCUSD")
+
+            await _subscribed(2)
+            await bucket.resubscribe(2)
+            await _unsubscribed(2)
+            await wss.unsubscribe(sub_id)
+            await _subscribed(3)
+            await _unsubscribed(3)
+
+            self.assertEqual(_events()[2:], [ "subscribe", "unsubscribe", "subscribe", "unsubscribe" ])
+            self.assertEqual((bucket.subscriptions, bucket.pendings, bucket.resubscriptions), ({ }, { }, { }))
+            self.assertEqual(len(wss.registry), 0)
+
+            sub_id = await wss.subscribe("ticker", symbol="tBTCUSD")
+
+            await _subscribed(4)
+            await wss.unsubscribe(sub_id)
+
+            #pylint: disable-next=protected-access
+            await bucket._BfxWebSocketBucket__recover_state()
+
+            self.assertEqual(_events()[6:], [ "subscribe", "unsubscribe" ])
+            self.assertEqual((bucket.subscriptions, bucket.pendings, bucket.resubscriptions), ({ }, { }, { }))
+            self.assertEqual(len(wss.registry), 0)
+
+        asyncio.run(_test())
+
+    def test_bucket_reconnection(self):
+        async def _test():
+            connections = [ ]
+
+            async def _reject(_path, _headers):
+                if not connections:
+                    connections.append(None)
+
+                    return HTTPStatus.TOO_MANY_REQUESTS, [ ], b""
+
+                return None
+
+            async def _serve(websocket, _path):
+                connections.append(frames := [ ])
+
+                async for frame in websocket:
+                    frames.append(message := json.loads(frame))
+
+                    await websocket.send(json.dumps({ "event": "subscribed", "channel": "ticker",
+                        "chanId": len(connections), "subId": message["subId"], "symbol": "tBTCUSD" }))
+
+                    if len(connections) == 2:
+                        websocket.transport.abort()
+
+            async with websockets.serve(_serve, "localhost", 0, process_request=_reject) as server:
+                logger, port = _Logger(), server.sockets[0].getsockname()[1]
+
+                bucket = BfxWebSocketBucket(f"ws://localhost:{port}", AsyncIOEventEmitter(), logger=logger)
+
+                task = asyncio.create_task(bucket.connect())
+
+                await asyncio.wait_for(bucket.on_open_event.wait(), 5.0)
+
+                await bucket.subscribe("ticker", sub_id="ticker", symbol="tBTCUSD")
+
+                while 3 not in bucket.subscriptions:
+                    await asyncio.sleep(0.01)
+
+                await bucket.close()
+
+                await asyncio.wait_for(task, 5.0)
+
+            self.assertEqual([ frame["subId"] for frame in connections[1] + connections[2] ], [ "ticker", "ticker" ])
+            self.assertEqual(len(logger.warnings), 2)
+            self.assertIn("no.1", logger.warnings[0])
+            self.assertIn("InvalidStatusCode", logger.warnings[0])
+            self.assertIn("no.1", logger.warnings[1])
+            self.assertIn("connection closed (1006)", logger.warnings[1])
+
+        asyncio.run(_test())
+
+    def test_client_reconnection(self):
+        class _Bucket:
+            def __init__(self):
+                self.on_open_event = asyncio.Event()
+
+            async def connect(self):
+                self.on_open_event.set()
+
+                await asyncio.sleep(0)
+
+                self.on_open_event.clear()
+
+                await asyncio.Event().wait()
+
+        async def _test():
+            connections, opened = [ ], asyncio.Queue()
+
+            async def _serve(websocket, _path):
+                connections.append(websocket)
+
+                if len(connections) == 1:
+                    await asyncio.sleep(0.05)
+
+                    websocket.transport.abort()
+
+                await websocket.wait_closed()
+
+            async with websockets.serve(_serve, "localhost", 0) as server:
+                wss = BfxWebSocketClient(f"ws://localhost:{server.sockets[0].getsockname()[1]}", None)
+
+                wss.logger, wss.buckets = _Logger(), [ _Bucket() ]
+
+                wss.event_emitter.on("open", lambda: opened.put_nowait(len(connections)))
+
+                #pylint: disable-next=protected-access
+                task = asyncio.create_task(wss._BfxWebSocketClient__connect())
+
+                self.assertEqual(await asyncio.wait_for(opened.get(), 5.0), 1)
+                self.assertEqual(await asyncio.wait_for(opened.get(), 5.0), 2)
+
+                task.cancel()
+
+        asyncio.run(_test())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+import unittest, asyncio
+
+from pyee.asyncio import AsyncIOEventEmitter
+
+from ..types import TradingPairBook, Candle
+from ..websocket.client import BfxWebSocketBucket
+from ..websocket.enums import ConfFlag
+from ..websocket.handlers import PublicChannelsHandler
+
+def _ticker(last_price):
+    return [ 100.0, 1.0, 101.0, 1.0, 0.5, 0.005, last_price, 1000.0, 110.0, 90.0 ]
+
+class TestWebSocketHandlers(unittest.TestCase):
+    def test_conflated_handler(self):
+        async def _test():
+            emitter, updates = AsyncIOEventEmitter(), [ ]
+
+            emitter.on("t_ticker_update", lambda _, ticker: updates.append(ticker.last_price))
+
+            handler = PublicChannelsHandler(emitter)
+
+            handler.prepare("ticker", 0.05)
+
+            handler.subscribe(1, { "event": "subscribed", "channel": "ticker", "chanId": 1, "subId": "ticker",
+                "symbol": "tBTCUSD" })
+
+            for last_price in (1.0, 2.0, 3.0):
+                handler.handle(1, _ticker(last_price))
+
+            self.assertEqual(updates, [ 1.0 ])
+
+            await asyncio.sleep(0.1)
+
+            self.assertEqual(updates, [ 1.0, 3.0 ])
+
+            handler.handle(1, _ticker(4.0))
+
+            self.assertEqual(updates, [ 1.0, 3.0, 4.0 ])
+
+            handler.handle(1, _ticker(5.0))
+
+            handler.unsubscribe(1)
+
+            await asyncio.sleep(0.1)
+
+            self.assertEqual(updates, [ 1.0, 3.0, 4.0 ])
+
+        asyncio.run(_test())
+
+    def test_pull_handler(self):
+        emitter, events = AsyncIOEventEmitter(), [ ]
+
+        emitter.on("candles_snapshot", lambda _, candles: events.append(("candles_snapshot", len(candles))))
+        emitter.on("candles_update", lambda _, candle: events.append(("candles_update", candle)))
+
+        handler = PublicChannelsHandler(emitter)
+
+        handler.prepare("candles", "pull")
+
+        handler.subscribe(1, { "event": "subscribed", "channel": "candles", "chanId": 1, "subId": "candles",
+            "key": "trade:1m:tBTCUSD" })
+
+        self.assertIsNone(handler.get_latest("candles"))
+
+        handler.handle(1, [ [ 1, 100.0, 101.0, 102.0, 99.0, 10.0 ], [ 0, 99.0, 100.0, 101.0, 98.0, 5.0 ] ])
+
+        for mts in (2, 3):
+            handler.handle(1, [ mts, 101.0, 102.0, 103.0, 100.0, 1.0 ])
+
+        self.assertEqual(events, [ ("candles_snapshot", 2) ])
+        self.assertEqual(handler.get_latest("candles"), Candle(3, 101.0, 102.0, 103.0, 100.0, 1.0))
+
+    def test_bulk_updates_handler(self):
+        emitter, events = AsyncIOEventEmitter(), [ ]
+
+        for event in ("t_book_snapshot", "t_book_batch_update", "t_book_update"):
+            emitter.on(event, lambda _, data, event=event: events.append((event, data)))
+
+        handler = PublicChannelsHandler(emitter)
+
+        subscription = { "event": "subscribed", "channel": "book", "chanId": 1, "subId": "book",
+            "symbol": "tBTCUSD", "prec": "P0", "freq": "F0", "len": "25" }
+
+        handler.subscribe(1, subscription)
+
+        handler.handle(1, [ [ 100.0, 1, 1.0 ], [ 101.0, 1, -1.0 ] ])
+        handler.handle(1, [ [ 100.0, 0, 1.0 ], [ 99.0, 2, 3.0 ] ])
+        handler.handle(1, [ 102.0, 1, -2.0 ])
+
+        self.assertEqual(events, [
+            ("t_book_snapshot", [ TradingPairBook(100.0, 1, 1.0), TradingPairBook(101.0, 1, -1.0) ]),
+            ("t_book_batch_update", [ TradingPairBook(100.0, 0, 1.0), TradingPairBook(99.0, 2, 3.0) ]),
+            ("t_book_update", TradingPairBook(100.0, 0, 1.0)),
+            ("t_book_update", TradingPairBook(99.0, 2, 3.0)),
+            ("t_book_update", TradingPairBook(102.0, 1, -2.0))
+        ])
+
+        handler.reset(1)
+
+        handler.subscribe(1, subscription)
+
+        handler.handle(1, [ [ 100.0, 2, 2.0 ] ])
+
+        self.assertEqual(events[-1], ("t_book_snapshot", [ TradingPairBook(100.0, 2, 2.0) ]))
+
+    def test_sequence_gap(self):
+        async def _test():
+            emitter, gaps = AsyncIOEventEmitter(), [ ]
+
+            emitter.on("sequence_gap", lambda expected, received: gaps.append((expected, received)))
+
+            bucket = BfxWebSocketBucket("", emitter, flags=ConfFlag.SEQ_ALL, resubscribe_on_gap=True)
+
+            resubscriptions = [ ]
+
+            async def _resubscribe(chan_id):
+                resubscriptions.append(chan_id)
+
+            bucket.resubscribe, bucket.subscriptions = _resubscribe, { 1: { }, 2: { } }
+
+            #pylint: disable-next=protected-access
+            decode = bucket._BfxWebSocketBucket__decode
+
+            for frame in ("[1,[100.0,1,1.0],1]", '[2,"hb",2]', "[1,[100.0,0,1.0],3]"):
+                decode(frame)
+
+            self.assertEqual((gaps, bucket.sequence), ([ ], 3))
+
+            decode('[2,"te",[1,2,3.0,4.0],5]')
+
+            await asyncio.sleep(0)
+
+            self.assertEqual((gaps, bucket.sequence, bucket.sequences), ([ (4, 5) ], 5, { 1: 3, 2: 5 }))
+            self.assertEqual(resubscriptions, [ 1, 2 ])
+
+        asyncio.run(_test())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,28 @@
+import unittest
+
+from ..websocket.latency import Histogram
+
+class TestWebSocketLatency(unittest.TestCase):
+    def test_histogram(self):
+        histogram = Histogram(precision=7)
+
+        for value in range(1, 100_001):
+            histogram.record(value)
+
+        self.assertEqual(histogram.count, 100_000)
+        self.assertEqual((histogram.min, histogram.max), (1, 100_000))
+        self.assertEqual(histogram.mean, 50_000.5)
+
+        for percentile in (1, 50, 90, 99, 99.9):
+            expected = 100_000 * percentile / 100
+
+            self.assertLessEqual(abs(histogram.percentile(percentile) - expected) / expected, 2 / 2 ** 7)
+
+        self.assertEqual(histogram.percentile(100), 100_000)
+
+        histogram.reset()
+
+        self.assertIsNone(histogram.percentile(50))
+
+if __name__ == "__main__":
+    unittest.main()
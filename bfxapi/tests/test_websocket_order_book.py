@@ -0,0 +1,131 @@
+import unittest, asyncio, zlib
+
+from ..types import TradingPairBook, FundingCurrencyBook, TradingPairRawBook
+from ..websocket.client import BfxWebSocketClient
+from ..websocket.order_book import _format_number, _BaseOrderBook, OrderBook, OrderBooks, RawOrderBook
+
+class TestWebSocketOrderBook(unittest.TestCase):
+    def test_order_book(self):
+        self.assertRaises(TypeError, _BaseOrderBook)
+
+        book = OrderBook()
+
+        book.snapshot([
+            TradingPairBook(100.0, 1, 2.0), TradingPairBook(99.0, 2, 1.0), TradingPairBook(101.0, 1, 0.5),
+            TradingPairBook(102.0, 1, -1.0), TradingPairBook(104.0, 3, -2.0), TradingPairBook(103.0, 1, -0.5)
+        ])
+
+        self.assertEqual(book.best_bid().price, 101.0)
+        self.assertEqual(book.best_ask().price, 102.0)
+        self.assertEqual(book.spread(), 1.0)
+
+        book.update(TradingPairBook(101.0, 0, 1))
+        book.update(TradingPairBook(102.5, 1, -3.0))
+        book.update(TradingPairBook(100.0, 2, 4.0))
+
+        bids, asks = book.depth(2)
+
+        self.assertEqual([ level.price for level in bids ], [ 100.0, 99.0 ])
+        self.assertEqual([ level.price for level in asks ], [ 102.0, 102.5 ])
+
+        self.assertEqual(book.bids.amount, 5.0)
+        self.assertEqual(book.asks.cumulative(2), 4.0)
+        self.assertEqual([ level.price for level in book.asks ], [ 102.0, 102.5, 103.0, 104.0 ])
+
+    def test_order_book_funding(self):
+        book = OrderBook(funding=True)
+
+        book.snapshot([
+            FundingCurrencyBook(0.0002, 2, 1, 100.0), FundingCurrencyBook(0.0003, 30, 1, 50.0),
+            FundingCurrencyBook(0.0001, 2, 2, -200.0)
+        ])
+
+        self.assertEqual(book.best_ask().rate, 0.0002)
+        self.assertEqual(book.best_bid().rate, 0.0001)
+
+        book.update(FundingCurrencyBook(0.0002, 2, 0, 1))
+
+        self.assertEqual(book.best_ask().rate, 0.0003)
+        self.assertEqual(len(book.asks), 1)
+
+    def test_raw_order_book(self):
+        book = RawOrderBook()
+
+        book.snapshot([
+            TradingPairRawBook(1, 100.0, 1.0), TradingPairRawBook(2, 100.0, 2.0), TradingPairRawBook(3, 100.0, 0.5),
+            TradingPairRawBook(4, 99.0, 1.0), TradingPairRawBook(5, 101.0, -1.0), TradingPairRawBook(6, 101.0, -3.0)
+        ])
+
+        self.assertEqual(len(book), 6)
+        self.assertEqual(book.best_bid().amount, 3.5)
+        self.assertEqual(book.best_ask().count, 2)
+        self.assertEqual(book.position(3), 2)
+
+        book.update(TradingPairRawBook(1, 0, 1))
+        book.update(TradingPairRawBook(2, 100.0, 1.5))
+        book.update(TradingPairRawBook(4, 101.5, -1.0))
+
+        self.assertEqual(book.position(2), 0)
+        self.assertEqual(book.position(3), 1)
+        self.assertEqual(book.get(2).amount, 1.5)
+        self.assertEqual(book.level(4).price, 101.5)
+        self.assertEqual([ order.order_id for order in book.best_bid() ], [ 2, 3 ])
+
+        self.assertEqual(book.bids.amount, 2.0)
+        self.assertEqual(book.asks.amount, 5.0)
+        self.assertEqual(len(book.bids), 1)
+        self.assertIsNone(book.get(1))
+
+    def test_order_book_checksum(self):
+        def _signed(checksum):
+            return checksum - (1 << 32) if checksum & 0x80000000 else checksum
+
+        book, raw_book = OrderBook(), RawOrderBook()
+
+        book.snapshot([ TradingPairBook(101.0, 1, 0.5), TradingPairBook(100.0, 2, 2), TradingPairBook(102.0, 1, -1.0) ])
+
+        raw_book.snapshot([ TradingPairRawBook(7, 100.0, 0.00001), TradingPairRawBook(8, 101.0, -2.5) ])
+
+        self.assertEqual(book.checksum(), _signed(zlib.crc32(b"101:0.5:102:-1:100:2")))
+        self.assertEqual(raw_book.checksum(), _signed(zlib.crc32(b"7:0.00001:8:-2.5")))
+
+        book.update(TradingPairBook(101.0, 2, 1.25))
+
+        self.assertEqual(book.checksum(), _signed(zlib.crc32(b"101:1.25:102:-1:100:2")))
+
+        self.assertEqual([ _format_number(number) for number in (1e-7, 1.5e-6, -3e-5, 2.0, 123.456) ],
+            [ "1e-7", "0.0000015", "-0.00003", "2", "123.456" ])
+
+    def test_order_books_checksum(self):
+        async def _test():
+            wss, resubscriptions = BfxWebSocketClient("", None), [ ]
+
+            async def _resubscribe(sub_id):
+                resubscriptions.append(sub_id)
+
+            wss.resubscribe, books = _resubscribe, OrderBooks(wss)
+
+            subscription = { "subId": "book", "symbol": "tBTCUSD" }
+
+            wss.event_emitter.emit("t_book_snapshot", subscription,
+                [ TradingPairBook(100.0, 1, 2.0), TradingPairBook(101.0, 1, -1.0) ])
+
+            checksum = books["tBTCUSD"].checksum()
+
+            wss.event_emitter.emit("t_book_checksum", subscription, checksum)
+            wss.event_emitter.emit("t_book_update", subscription, TradingPairBook(100.0, 2, 3.0))
+
+            await asyncio.sleep(0)
+
+            self.assertEqual(resubscriptions, [ ])
+
+            wss.event_emitter.emit("t_book_checksum", subscription, checksum)
+
+            await asyncio.sleep(0)
+
+            self.assertEqual(resubscriptions, [ "book" ])
+
+        asyncio.run(_test())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import unittest, asyncio
+
+from ..websocket.pipeline import _Queue, Pipeline
+
+class TestWebSocketPipeline(unittest.TestCase):
+    def test_pipeline_queue(self):
+        async def _test():
+            pipeline = Pipeline(maxsize=3, policy="drop")
+
+            conflating, dropping = _Queue(3, "conflate", pipeline), _Queue(3, "drop", pipeline)
+
+            for value in range(5):
+                await conflating.put(("ticker", value), True, "ticker")
+                await dropping.put(("trade", value), True)
+
+            await conflating.put(("book", 1.0, 1), True, ("book", 1.0))
+            await conflating.put(("book", 2.0, 1), True, ("book", 2.0))
+            await conflating.put(("book", 1.0, 0), True, ("book", 1.0))
+
+            self.assertEqual([ await conflating.get() for _ in range(3) ],
+                [ ("ticker", 4), ("book", 1.0, 0), ("book", 2.0, 1) ])
+
+            self.assertEqual([ await dropping.get() for _ in range(3) ],
+                [ ("trade", 0), ("trade", 1), ("trade", 2) ])
+
+            self.assertEqual((pipeline.conflated, pipeline.dropped), (5, 2))
+
+            queue = _Queue(8, "conflate", pipeline)
+
+            await queue.put([ 1, [ 100.0, 1, 1.0 ] ], True, (1, 100.0), 1)
+            await queue.put([ 2, [ 100.0, 1, 1.0 ] ], True, (2, 100.0), 2)
+            await queue.put([ 1, "cs", 123 ], False, None, 1)
+            await queue.put([ 1, [ 100.0, 2, 3.0 ] ], True, (1, 100.0), 1)
+            await queue.put([ 2, [ 100.0, 0, 1.0 ] ], True, (2, 100.0), 2)
+
+            self.assertEqual([ await queue.get() for _ in range(4) ], [
+                [ 1, [ 100.0, 1, 1.0 ] ], [ 2, [ 100.0, 0, 1.0 ] ], [ 1, "cs", 123 ], [ 1, [ 100.0, 2, 3.0 ] ] ])
+
+            await queue.put([ 1, [ 100.0, 3, 4.0 ] ], True, (1, 100.0), 1)
+
+            self.assertEqual(await queue.get(), [ 1, [ 100.0, 3, 4.0 ] ])
+
+        asyncio.run(_test())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest, asyncio, time
+
+from ..websocket.recovery import RateLimiter, Recovery
+
+class TestWebSocketRecovery(unittest.TestCase):
+    def test_rate_limiter(self):
+        async def _test():
+            limiter, start = RateLimiter(rate=100, burst=5), time.monotonic()
+
+            await asyncio.gather(*[ limiter.acquire() for _ in range(5) ])
+
+            self.assertLess(time.monotonic() - start, 0.01)
+
+            await asyncio.gather(*[ limiter.acquire() for _ in range(10) ])
+
+            self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+        asyncio.run(_test())
+
+    def test_recovery(self):
+        recovery = Recovery([ "a", "b", "c" ])
+
+        self.assertFalse(recovery.ack("a"))
+        self.assertFalse(recovery.ack("a"))
+        self.assertFalse(recovery.ack("d"))
+        self.assertFalse(recovery.ack("b", failed=True))
+        self.assertTrue(recovery.ack("c"))
+
+        self.assertTrue(recovery.completed)
+        self.assertEqual((recovery.total, recovery.failed), (3, 1))
+        self.assertGreaterEqual(recovery.duration, 0)
+
+if __name__ == "__main__":
+    unittest.main()
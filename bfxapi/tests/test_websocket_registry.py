@@ -0,0 +1,34 @@
+import unittest
+
+from ..websocket.registry import SubscriptionRegistry
+
+class TestWebSocketRegistry(unittest.TestCase):
+    def test_subscription_registry(self):
+        registry, bucket = SubscriptionRegistry(), object()
+
+        registry.register("a", key := SubscriptionRegistry.key("book", symbol="tBTCUSD", prec="P0"), bucket)
+
+        registry.alias(registry.find(SubscriptionRegistry.key("book", prec="P0", symbol="tBTCUSD")), "b")
+
+        self.assertIsNone(registry.find(SubscriptionRegistry.key("book", symbol="tBTCUSD", prec="R0")))
+
+        registry.bind("a", 17)
+
+        self.assertEqual((registry.get_bucket("b"), registry.get_chan_id("b"), registry.resolve("b")),
+            (bucket, 17, "a"))
+
+        self.assertIsNone(registry.release("a"))
+        self.assertIsNone(registry.release("a"))
+        self.assertEqual(registry.find(key), "a")
+        self.assertFalse(registry.released("a"))
+        self.assertEqual(registry.release("b"), "a")
+        self.assertIsNone(registry.find(key))
+        self.assertTrue(registry.released("a"))
+
+        registry.unregister("a")
+
+        self.assertEqual((len(registry), registry.get_bucket("b"), registry.get_chan_id("a")), (0, None, None))
+        self.assertFalse(registry.released("a"))
+
+if __name__ == "__main__":
+    unittest.main()
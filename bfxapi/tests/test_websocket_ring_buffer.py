@@ -0,0 +1,84 @@
+import unittest, math, subprocess, sys, time
+
+from ..types import TradingPairBook, TradingPairTrade
+from ..websocket.ring_buffer import RecordKind, RecordFlag, RingBufferWriter, RingBufferReader
+
+class TestWebSocketRingBuffer(unittest.TestCase):
+    def test_ring_buffer(self):
+        writer = RingBufferWriter(capacity=4)
+
+        reader = RingBufferReader(writer.name)
+
+        try:
+            writer.write(RecordKind.BOOK, "tBTCUSD", (20_000.0, 2, 1.5))
+            writer.write(RecordKind.TRADE, "tETHUSD", (1, 1676903432_000, -0.5, None))
+
+            first, second, *_ = reader.read()
+
+            self.assertEqual(first, (RecordKind.BOOK, "tBTCUSD", (20_000.0, 2.0, 1.5), RecordFlag(0)))
+            self.assertEqual(second[:2], (RecordKind.TRADE, "tETHUSD"))
+            self.assertTrue(math.isnan(second.values[3]))
+
+            for price in range(6):
+                writer.write(RecordKind.BOOK, "tBTCUSD", (float(price), 1, 1.0))
+
+            self.assertEqual([ record.values[0] for record in reader.read(limit=3) ], [ 2.0, 3.0, 4.0 ])
+            self.assertEqual([ record.values[0] for record in reader.read() ], [ 5.0 ])
+            self.assertEqual(reader.lost, 2)
+        finally:
+            reader.close()
+
+            writer.close()
+
+    def test_ring_buffer_values(self):
+        writer = RingBufferWriter(capacity=8)
+
+        reader = RingBufferReader(writer.name)
+
+        try:
+            #pylint: disable-next=protected-access
+            listener = writer._RingBufferWriter__listener(RecordKind.BOOK, True)
+
+            listener({ "symbol": "tBTCUSD" },
+                [ TradingPairBook(1.0, 1, 2.0), getattr(TradingPairBook, "Compact")(2.0, 1, -2.0) ])
+
+            #pylint: disable-next=protected-access
+            writer._RingBufferWriter__listener(RecordKind.TRADE, False)({ "symbol": "tBTCUSD" },
+                TradingPairTrade(5, 10, 0.25, 3.0))
+
+            self.assertEqual([ (record.values, record.flags) for record in reader.read() ], [
+                ((), RecordFlag.RESET), ((1.0, 1.0, 2.0), RecordFlag.SNAPSHOT),
+                ((2.0, 1.0, -2.0), RecordFlag.SNAPSHOT), ((5.0, 10.0, 0.25, 3.0), RecordFlag(0)) ])
+
+            writer.write(RecordKind.CANDLE, key := "trade:30m:fUSD:a30:p2:p30", (1.0, ))
+
+            self.assertEqual(reader.read()[0].symbol, key)
+
+            with self.assertRaises(ValueError):
+                writer.write(RecordKind.CANDLE, "trade:1m:" + "x" * 40, (1.0, ))
+        finally:
+            reader.close()
+
+            writer.close()
+
+    def test_ring_buffer_reader_exit(self):
+        writer = RingBufferWriter(capacity=4)
+
+        try:
+            subprocess.run([ sys.executable, "-c", "from bfxapi.websocket.ring_buffer import RingBufferReader; " \
+                f"RingBufferReader({writer.name!r}).close()" ], check=True)
+
+            time.sleep(0.5) # the resource tracker of the reader process exits asynchronously
+
+            reader = RingBufferReader(writer.name)
+
+            writer.write(RecordKind.TICKER, "tBTCUSD", (1.0, ))
+
+            self.assertEqual(len(reader.read()), 1)
+
+            reader.close()
+        finally:
+            writer.close()
+
+if __name__ == "__main__":
+    unittest.main()
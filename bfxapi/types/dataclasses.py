@@ -3,7 +3,7 @@ from typing import Union, Type, \
 
 from dataclasses import dataclass
 
-from .labeler import _Type, partial, compose
+from .labeler import _Type, partial, compact, compose
 
 JSON = Union[Dict[str, "JSON"], List["JSON"], bool, int, float, str, Type[None]]
 
@@ -13,7 +13,7 @@ JSON = Union[Dict[str, "JSON"], List["JSON"], bool, int, float, str, Type[None]]
 class PlatformStatus(_Type):
     status: int
 
-@dataclass
+@compose(compact, dataclass)
 class TradingPairTicker(_Type):
     bid: float
     bid_size: float
@@ -26,7 +26,7 @@ class TradingPairTicker(_Type):
     high: float
     low: float
 
-@dataclass
+@compose(compact, dataclass)
 class FundingCurrencyTicker(_Type):
     frr: float
     bid: float
@@ -50,14 +50,14 @@ class TickersHistory(_Type):
     ask: float
     mts: int
 
-@dataclass
+@compose(compact, dataclass)
 class TradingPairTrade(_Type):
     id: int
     mts: int
     amount: float
     price: float
 
-@dataclass
+@compose(compact, dataclass)
 class FundingCurrencyTrade(_Type):
     id: int
     mts: int
@@ -65,26 +65,26 @@ class FundingCurrencyTrade(_Type):
     rate: float
     period: int
 
-@dataclass
+@compose(compact, dataclass)
 class TradingPairBook(_Type):
     price: float
     count: int
     amount: float
 
-@dataclass
+@compose(compact, dataclass)
 class FundingCurrencyBook(_Type):
     rate: float
     period: int
     count: int
     amount: float
 
-@dataclass
+@compose(compact, dataclass)
 class TradingPairRawBook(_Type):
     order_id: int
     price: float
     amount: float
 
-@dataclass
+@compose(compact, dataclass)
 class FundingCurrencyRawBook(_Type):
     offer_id: int
     period: int
@@ -96,13 +96,13 @@ class Statistic(_Type):
     mts: int
     value: float
 
-@dataclass
+@compose(compact, dataclass)
 class Candle(_Type):
     mts: int
-    open: int
-    close: int
-    high: int
-    low: int
+    open: float
+    close: float
+    high: float
+    low: float
     volume: float
 
 @dataclass
@@ -1,5 +1,12 @@
-from typing import Type, Generic, TypeVar, Iterable, \
-    Dict, List, Tuple, Any, cast
+from typing import Type, Generic, TypeVar, Iterable, Sequence, \
+    Callable, Dict, List, Tuple, Union, Literal, Optional, Any, cast, overload
+
+from operator import itemgetter
+
+try:
+    import numpy #type: ignore
+except ImportError:
+    numpy = None #type: ignore
 
 T = TypeVar("T", bound="_Type")
 
@@ -27,19 +34,153 @@ def partial(cls):
 
     return cls
 
+def compact(cls):
+    fields = tuple(cls.__dataclass_fields__.keys())
+
+    namespace = { key: value for key, value in cls.__dict__.items() \
+        if key not in (*fields, "__dict__", "__weakref__") }
+
+    klass = type(cls)(cls.__name__, cls.__bases__, { **namespace, "__slots__": fields })
+
+    klass.__qualname__ = f"{cls.__qualname__}.Compact"
+
+    setattr(cls, "Compact", klass)
+
+    return cls
+
 class _Type:
     """
     Base class for any dataclass serializable by the _Serializer generic class.
     """
 
+    __slots__ = ()
+
+def _compile_parsers(name: str, klass: Type[_Type], labels: List[str], ignore: List[str],
+                     serializers: Optional[Dict[str, "_Serializer[Any]"]] = None
+                    ) -> Tuple[Callable[..., Any], Callable[[Sequence[Any]], List[Any]]]:
+    """
+    Generates (once) two specialized functions which map each wire index directly to its keyword argument:
+    the first one parses a single record, the second one parses a sequence of records in a single pass.
+    """
+
+    serializers = serializers or { }
+
+    arguments = [
+        (f"{label}=serializers[{label!r}].parse(*values[{index}])" if label in serializers \
+            else f"{label}=values[{index}]")
+                for index, label in enumerate(labels) if label not in ignore
+    ]
+
+    message = f"{name} -> <labels> and <*args> arguments should contain the same amount of elements."
+
+    source = "\n".join([
+        "def parse(*values):",
+        f"    if len(values) < {len(labels)}:",
+        f"        raise AssertionError({message!r})",
+        f"    return klass({', '.join(arguments)})",
+        "def parse_many(rows):",
+        f"    parsed = [ klass({', '.join(arguments)}) for values in rows if len(values) >= {len(labels)} ]",
+        "    if len(parsed) != len(rows):",
+        f"        raise AssertionError({message!r})",
+        "    return parsed"
+    ])
+
+    namespace: Dict[str, Any] = { "klass": klass, "serializers": serializers }
+
+    #pylint: disable-next=exec-used
+    exec(compile(source, f"<{name} parser>", "exec"), namespace)
+
+    return namespace["parse"], namespace["parse_many"]
+
+def _to_column(values: List[Any]) -> Any:
+    if numpy is None:
+        return values
+
+    try:
+        if (array := numpy.array(values)).ndim == 1:
+            return array
+    except ValueError:
+        pass
+
+    array = numpy.empty(len(values), dtype=object)
+
+    for index, value in enumerate(values):
+        array[index] = value
+
+    return array
+
+class _LazyType(tuple):
+    """
+    Read-only view over a raw record which decodes each field on its first access.
+    Plain fields are read straight from the wire indexes, nested records are parsed (lazily) and cached.
+    """
+
+    _klass: Type[_Type]
+
+    _labels: List[str]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__qualname__}({list(self)!r})"
+
+    def materialize(self) -> _Type:
+        return self._klass(**{
+            label: isinstance(value := getattr(self, label), _LazyType) and value.materialize() or value
+                for label in self._labels
+        })
+
+    @staticmethod
+    def __nested(label: str, index: int, serializer: "_Serializer[Any]") -> property:
+        def fget(self: _LazyType) -> Any:
+            if label not in self.__dict__:
+                self.__dict__[label] = (values := self[index]) is not None \
+                    and serializer.parse_lazy(*values) or None
+
+            return self.__dict__[label]
+
+        return property(fget)
+
+    @staticmethod
+    def generate(klass: Type[_Type], labels: List[str], ignore: List[str],
+                 serializers: Optional[Dict[str, "_Serializer[Any]"]] = None) -> Type["_LazyType"]:
+        serializers = serializers or { }
+
+        namespace: Dict[str, Any] = {
+            "_klass": klass,
+            "_labels": [ label for label in labels if label not in ignore ]
+        }
+
+        for index, label in enumerate(labels):
+            if label not in ignore:
+                if label in serializers:
+                    namespace[label] = _LazyType.__nested(label, index, serializers[label])
+                else: namespace[label] = property(itemgetter(index))
+
+        return type(f"{klass.__name__}.Lazy", (_LazyType, ), namespace)
+
+_GENERATED: Dict[Tuple[str, type, Tuple[str, ...], Tuple[str, ...]], \
+    Tuple[Callable[..., Any], Callable[[Sequence[Any]], List[Any]], Type[_LazyType]]] = { }
+
 class _Serializer(Generic[T]):
     def __init__(self, name: str, klass: Type[_Type], labels: List[str],
                  *, flat: bool = False, ignore: List[str] = [ "_PLACEHOLDER" ]):
         self.name, self.klass, self.__labels, self.__flat, self.__ignore = name, klass, labels, flat, ignore
 
+        # Serializers such as _Notification are instantiated for each message, so the
+        # code they generate is cached by (name, klass, labels, ignore).
+        if (generated := _GENERATED.get(key := (name, klass, tuple(labels), tuple(ignore)))) is None:
+            generated = _GENERATED[key] = (*_compile_parsers(name, klass, labels, ignore),
+                _LazyType.generate(klass, labels, ignore))
+
+        self._parser, self._many_parser, self._lazy_klass = generated
+
+        self.compact: _Serializer[T] = self
+
+        if hasattr(klass, "Compact"):
+            self.compact = _Serializer[T](name, getattr(klass, "Compact"), labels, flat=flat, ignore=ignore)
+
     def _serialize(self, *args: Any) -> Iterable[Tuple[str, Any]]:
         if self.__flat:
-            args = tuple(_Serializer.__flatten(list(args)))
+            args = tuple(_Serializer.__flatten(args))
 
         if len(self.__labels) > len(args):
             raise AssertionError(f"{self.name} -> <labels> and <*args> " \
@@ -50,20 +191,94 @@ class _Serializer(Generic[T]):
                 yield label, args[index]
 
     def parse(self, *values: Any) -> T:
-        return cast(T, self.klass(**dict(self._serialize(*values))))
+        if self.__flat:
+            return cast(T, self._parser(*_Serializer.__flatten(values)))
+
+        return cast(T, self._parser(*values))
+
+    def parse_lazy(self, *values: Any) -> T:
+        if self.__flat:
+            values = tuple(_Serializer.__flatten(values))
+
+        if len(self.__labels) > len(values):
+            raise AssertionError(f"{self.name} -> <labels> and <*args> " \
+                "arguments should contain the same amount of elements.")
+
+        return cast(T, self._lazy_klass(values))
+
+    @overload
+    def parse_many(self, rows: Sequence[Sequence[Any]], *, columnar: Literal[False] = False) -> List[T]: ...
+
+    @overload
+    def parse_many(self, rows: Sequence[Sequence[Any]], *, columnar: Literal[True]) -> Dict[str, Any]: ...
+
+    def parse_many(self, rows: Sequence[Sequence[Any]], *, columnar: bool = False) -> Union[List[T], Dict[str, Any]]:
+        if self.__flat:
+            rows = [ _Serializer.__flatten(row) for row in rows ]
+
+        if not columnar:
+            return cast(List[T], self._many_parser(rows))
+
+        if any(len(row) < len(self.__labels) for row in rows):
+            raise AssertionError(f"{self.name} -> <labels> and <*args> " \
+                "arguments should contain the same amount of elements.")
+
+        columns = list(zip(*rows)) or [ () ] * len(self.__labels)
+
+        return {
+            label: _to_column(self._parse_column(label, columns[index]))
+                for index, label in enumerate(self.__labels) if label not in self.__ignore
+        }
+
+    def parse_array(self, rows: Sequence[Sequence[Any]]) -> Any:
+        if numpy is None:
+            raise ImportError(f"{self.name} -> numpy must be installed to parse rows into structured arrays.")
+
+        if self.__flat:
+            rows = [ _Serializer.__flatten(row) for row in rows ]
+
+        if any(len(row) < len(self.__labels) for row in rows):
+            raise AssertionError(f"{self.name} -> <labels> and <*args> " \
+                "arguments should contain the same amount of elements.")
+
+        columns = list(zip(*rows)) or [ () ] * len(self.__labels)
+
+        fields = [ (index, label, { int: "i8", float: "f8" }.get(self.klass.__annotations__[label], "O")) \
+            for index, label in enumerate(self.__labels) if label not in self.__ignore ]
+
+        array = numpy.empty(len(rows), dtype=[
+            (label, (kind == "i8" and None in columns[index]) and "f8" or kind) for index, label, kind in fields
+        ])
+
+        for index, label, _ in fields:
+            array[label] = columns[index]
+
+        return array
+
+    #pylint: disable-next=unused-argument
+    def _parse_column(self, label: str, column: Sequence[Any]) -> List[Any]:
+        return list(column)
 
     def get_labels(self) -> List[str]:
         return [ label for label in self.__labels if label not in self.__ignore ]
 
-    @classmethod
-    def __flatten(cls, array: List[Any]) -> List[Any]:
-        if len(array) == 0:
-            return array
+    @staticmethod
+    def __flatten(array: Iterable[Any]) -> List[Any]:
+        flattened: List[Any] = [ ]
 
-        if isinstance(array[0], list):
-            return cls.__flatten(array[0]) + cls.__flatten(array[1:])
+        stack = [ iter(array) ]
 
-        return array[:1] + cls.__flatten(array[1:])
+        while stack:
+            for value in stack[-1]:
+                if isinstance(value, list):
+                    stack.append(iter(value))
+
+                    break
+
+                flattened.append(value)
+            else: stack.pop()
+
+        return flattened
 
 class _RecursiveSerializer(_Serializer, Generic[T]):
     def __init__(self, name: str, klass: Type[_Type], labels: List[str],
@@ -73,14 +288,15 @@ class _RecursiveSerializer(_Serializer, Generic[T]):
 
         self.serializers = serializers
 
-    def parse(self, *values: Any) -> T:
-        serialization = dict(self._serialize(*values))
+        self._parser, self._many_parser = _compile_parsers(name, klass, labels, ignore, serializers)
+
+        self._lazy_klass = _LazyType.generate(klass, labels, ignore, serializers)
 
-        for key in serialization:
-            if key in self.serializers.keys():
-                serialization[key] = self.serializers[key].parse(*serialization[key])
+    def _parse_column(self, label: str, column: Sequence[Any]) -> List[Any]:
+        if label in self.serializers:
+            return [ self.serializers[label].parse(*value) for value in column ]
 
-        return cast(T, self.klass(**serialization))
+        return super()._parse_column(label, column)
 
 def generate_labeler_serializer(name: str, klass: Type[T], labels: List[str],
                                 *, flat: bool = False, ignore: List[str] = [ "_PLACEHOLDER" ]
@@ -23,7 +23,7 @@ class _Notification(_Serializer, Generic[T]):
         self.serializer, self.is_iterable = serializer, is_iterable
 
     def parse(self, *values: Any) -> Notification[T]:
-        notification = cast(Notification[T], Notification(**dict(self._serialize(*values))))
+        notification = cast(Notification[T], self._parser(*values))
 
         if isinstance(self.serializer, _Serializer):
             data = cast(List[Any], notification.data)
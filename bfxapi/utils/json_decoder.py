@@ -0,0 +1,22 @@
+import json, importlib
+
+from typing import Callable, Union, Literal, Any
+
+JSONBackend = Literal["auto", "orjson", "ujson", "simdjson", "json"]
+
+_FALLBACKS = [ "orjson", "simdjson", "ujson" ]
+
+def get_json_loads(backend: JSONBackend = "json") -> Callable[[Union[str, bytes]], Any]:
+    if backend == "json":
+        return json.loads
+
+    if backend != "auto":
+        return importlib.import_module(backend).loads
+
+    for module in _FALLBACKS:
+        try:
+            return importlib.import_module(module).loads
+        except ImportError:
+            continue
+
+    return json.loads
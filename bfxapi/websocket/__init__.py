@@ -1 +1,13 @@
 from .client import BfxWebSocketClient, BfxWebSocketBucket, BfxWebSocketInputs
+
+from .order_book import OrderBook, OrderBooks, RawOrderBook, RawOrderBooks
+
+from .pipeline import Pipeline
+
+from .recovery import RateLimiter, Recovery
+
+from .balancer import LoadBalancer
+
+from .registry import SubscriptionRegistry
+
+from .ring_buffer import RecordKind, RecordFlag, RingBufferWriter, RingBufferReader
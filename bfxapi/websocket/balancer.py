@@ -0,0 +1,98 @@
+from typing import List, Optional
+
+import asyncio, time
+
+from .client import BfxWebSocketBucket
+
+__all__ = [
+    "LoadBalancer"
+]
+
+class LoadBalancer:
+    """
+    Places new subscriptions on the bucket with the lowest load, i.e. the sum of the
+    message rates (exponentially weighted moving averages, in messages per second,
+    with the given half-life) of its channels.
+
+    With rebalance, it also migrates channels from the busiest bucket to the least
+    busy one, when the load of the former exceeds <threshold> times the load of the
+    latter, but only during quiet moments (i.e. when the current message rate of the
+    busiest bucket is below its average) and at most once per <cooldown> seconds.
+    """
+
+    #pylint: disable-next=too-many-arguments
+    def __init__(self,
+                 interval: float = 1.0,
+                 half_life: float = 30.0,
+                 rebalance: bool = False,
+                 threshold: float = 2.0,
+                 cooldown: float = 60.0):
+        self.interval, self.rebalance, self.threshold, self.cooldown = interval, rebalance, threshold, cooldown
+
+        self.alpha = 1 - 0.5 ** (interval / half_life)
+
+        self.migrations = 0
+
+    @staticmethod
+    def load(bucket: BfxWebSocketBucket) -> float:
+        return sum(bucket.rates.values())
+
+    def choose(self, buckets: List[BfxWebSocketBucket]) -> int:
+        return min(range(len(buckets)), key=lambda index: (
+            len(buckets[index].subscriptions) + len(buckets[index].pendings) \
+                >= BfxWebSocketBucket.MAXIMUM_SUBSCRIPTIONS_AMOUNT,
+            LoadBalancer.load(buckets[index]),
+            len(buckets[index].subscriptions) + len(buckets[index].pendings)
+        ))
+
+    async def run(self, buckets: List[BfxWebSocketBucket]) -> None:
+        measured = rebalanced = time.monotonic()
+
+        while True:
+            await asyncio.sleep(self.interval)
+
+            now = time.monotonic()
+
+            currents = [ bucket.meter(now - measured, self.alpha) for bucket in buckets ]
+
+            measured = now
+
+            if self.rebalance and now - rebalanced >= self.cooldown and await self.__rebalance(buckets, currents):
+                rebalanced = now
+
+    async def __rebalance(self, buckets: List[BfxWebSocketBucket], currents: List[float]) -> bool:
+        loads = [ LoadBalancer.load(bucket) for bucket in buckets ]
+
+        source = max(range(len(buckets)), key=loads.__getitem__)
+
+        targets = [ index for index, bucket in enumerate(buckets) if index != source and bucket.available ]
+
+        if not targets or currents[source] > loads[source]:
+            return False
+
+        target = min(targets, key=loads.__getitem__)
+
+        if (gap := loads[source] - loads[target]) <= 0 or loads[source] <= self.threshold * loads[target]:
+            return False
+
+        chan_id = self.__candidate(buckets[source], gap)
+
+        if chan_id is None:
+            return False
+
+        await buckets[source].migrate(chan_id, buckets[target])
+
+        self.migrations += 1
+
+        return True
+
+    @staticmethod
+    def __candidate(bucket: BfxWebSocketBucket, gap: float) -> Optional[int]:
+        candidates = [ (abs(gap / 2 - rate), chan_id) for chan_id, subscription in bucket.subscriptions.items() \
+            if chan_id not in bucket.resubscriptions \
+                and 0 < (rate := bucket.rates.get(subscription["subId"], 0)) < gap ]
+
+        if candidates:
+            return min(candidates)[1]
+
+        return None
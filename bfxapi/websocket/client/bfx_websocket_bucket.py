@@ -1,13 +1,28 @@
 from typing import Literal, TypeVar, Callable, cast
 
-import asyncio, json, uuid, websockets
+import asyncio, json, uuid, time, random, re, websockets
 
 from ..handlers import PublicChannelsHandler
 
+from ..enums import ConfFlag
+
+from ..latency import ChannelLatency
+
+from ..recovery import Recovery
+
+from ..registry import SubscriptionRegistry
+
 from ..exceptions import ConnectionNotOpen, TooManySubscriptions
 
+from ...utils.json_decoder import get_json_loads
+
 _HEARTBEAT = "hb"
 
+_HEARTBEAT_SUFFIX, _HEARTBEAT_FRAME = f',"{_HEARTBEAT}"]', \
+    re.compile(rf'\[(\d+),"{_HEARTBEAT}"(?:,(\d+))?(?:,(\d+))?\]')
+
+_HEARTBEAT_INFIX = f',"{_HEARTBEAT}",'
+
 F = TypeVar("F", bound=Callable[..., Literal[None]])
 
 def _require_websocket_connection(function: F) -> F:
@@ -19,68 +34,357 @@ def _require_websocket_connection(function: F) -> F:
 
     return cast(F, wrapper)
 
+class _Delay:
+    BACKOFF_MIN, BACKOFF_MAX = 1.92, 60.0
+
+    BACKOFF_INITIAL = 5.0
+
+    def __init__(self, backoff_factor):
+        self.__backoff_factor = backoff_factor
+        self.__backoff_delay = _Delay.BACKOFF_MIN
+        self.__initial_delay = random.random() * _Delay.BACKOFF_INITIAL
+
+    def next(self):
+        backoff_delay = self.peek()
+        __backoff_delay = self.__backoff_delay * self.__backoff_factor
+        self.__backoff_delay = min(__backoff_delay, _Delay.BACKOFF_MAX)
+
+        return backoff_delay
+
+    def peek(self):
+        return (self.__backoff_delay == _Delay.BACKOFF_MIN) \
+            and self.__initial_delay or self.__backoff_delay
+
 class BfxWebSocketBucket:
     VERSION = 2
 
     MAXIMUM_SUBSCRIPTIONS_AMOUNT = 25
 
-    def __init__(self, host, event_emitter, events_per_subscription):
-        self.host, self.event_emitter, self.events_per_subscription = host, event_emitter, events_per_subscription
-        self.websocket, self.subscriptions, self.pendings = None, {}, []
+    def __init__(self, host, event_emitter, *, flags = 0, resubscribe_on_gap = False, pipeline = None,
+                 limiter = None, watchdog = None, metering = False, registry = None, logger = None,
+                 compact = False, json_backend = "json"):
+        self.host, self.event_emitter, self.flags = host, event_emitter, flags
+        self.websocket, self.subscriptions, self.pendings = None, {}, {}
         self.on_open_event = asyncio.locks.Event()
 
-        self.handler = PublicChannelsHandler(event_emitter=self.event_emitter, \
-            events_per_subscription=self.events_per_subscription)
+        self.last_seen, self.last_received, self.resubscriptions = {}, 0.0, {}
+
+        self.metering, self.counts, self.rates = metering, {}, {}
+
+        self.sequencing, self.resubscribe_on_gap = bool(flags & ConfFlag.SEQ_ALL), resubscribe_on_gap
+
+        self.sequence, self.sequences = None, {}
+
+        self.timestamps, self.latencies, self.__latencies = bool(flags & ConfFlag.TIMESTAMP), {}, {}
+
+        self.trailing, self.pipeline, self.__channels = self.sequencing or self.timestamps, pipeline, {}
+
+        self.limiter, self.recovery, self.watchdog, self.__closing = limiter, None, watchdog, False
+
+        self.registry = registry if registry is not None else SubscriptionRegistry()
+
+        self.logger = logger
+
+        self.__loads = get_json_loads(json_backend)
+
+        self.handler = PublicChannelsHandler(event_emitter=self.event_emitter, compact=compact)
 
     async def connect(self):
         async def _connection():
             async with websockets.connect(self.host) as websocket:
                 self.websocket = websocket
+
+                if self.flags:
+                    await websocket.send(json.dumps({ "event": "conf", "flags": self.flags }))
+
+                self.sequence, self.last_received = None, time.monotonic()
+
                 self.on_open_event.set()
-                await self.__recover_state()
 
-                async for message in websocket:
-                    message = json.loads(message)
+                tasks = [ asyncio.create_task(self.__recover_state()) ]
 
-                    if isinstance(message, dict):
-                        if message["event"] == "subscribed" and (chan_id := message["chanId"]):
-                            self.pendings = [ pending \
-                                for pending in self.pendings if pending["subId"] != message["subId"] ]
+                if self.watchdog is not None:
+                    tasks.append(asyncio.create_task(self.__watch(websocket)))
 
-                            self.subscriptions[chan_id] = message
+                try:
+                    await self.__read(websocket)
+                finally:
+                    for task in tasks:
+                        task.cancel()
 
-                            sub_id = message["subId"]
+        self.__closing, delay, attempts = False, _Delay(backoff_factor=1.618), 0
 
-                            if "subscribed" not in self.events_per_subscription.get(sub_id, []):
-                                self.events_per_subscription.setdefault(sub_id, []).append("subscribed")
-                                self.event_emitter.emit("subscribed", message)
-                        elif message["event"] == "unsubscribed" and (chan_id := message["chanId"]):
-                            if message["status"] == "OK":
-                                del self.subscriptions[chan_id]
-                        elif message["event"] == "error":
-                            self.event_emitter.emit("wss-error", message["code"], message["msg"])
+        while not self.__closing:
+            try:
+                await _connection()
+            except websockets.exceptions.ConnectionClosedError as error:
+                if error.code not in (1006, 1012):
+                    return
 
-                    if isinstance(message, list):
-                        if (chan_id := message[0]) and message[1] != _HEARTBEAT:
-                            self.handler.handle(self.subscriptions[chan_id], *message[1:])
+                reason = f"connection closed ({error.code})"
+            except (OSError, asyncio.TimeoutError, websockets.exceptions.InvalidHandshake) as error:
+                reason = f"{type(error).__name__}: {error}" if str(error) else type(error).__name__
+            else: return
 
-        try:
-            await _connection()
-        except websockets.exceptions.ConnectionClosedError as error:
-            if error.code in (1006, 1012):
+            if self.on_open_event.is_set():
                 self.on_open_event.clear()
 
+                delay, attempts = _Delay(backoff_factor=1.618), 0
+
+            attempts, seconds = attempts + 1, delay.next()
+
+            if self.logger is not None and not self.__closing:
+                self.logger.warning(f"Bucket reconnection attempt no.{attempts} in {seconds:.2f} seconds " \
+                    f"({reason}).")
+
+            await asyncio.sleep(seconds)
+
+    async def __read(self, websocket):
+        if self.pipeline is not None:
+            return await self.pipeline.run(websocket, self.__decode, self.__dispatch, self.__classify)
+
+        decode, dispatch = self.__decode, self.__dispatch
+
+        async for message in websocket:
+            if (item := decode(message)) is not None:
+                await dispatch(*item)
+
+        return None
+
+    #pylint: disable-next=too-many-branches
+    def __decode(self, message, received = None):
+        if self.timestamps and received is None:
+            received = time.time()
+
+        self.last_received = now = time.monotonic()
+
+        if (message.endswith(_HEARTBEAT_SUFFIX) or (self.trailing and _HEARTBEAT_INFIX in message)) \
+                and (heartbeat := _HEARTBEAT_FRAME.fullmatch(message)):
+            chan_id = int(heartbeat.group(1))
+
+            if not self.trailing:
+                if self.watchdog is not None:
+                    self.last_seen[chan_id] = now
+
+                return None
+
+            message = [ chan_id, _HEARTBEAT, *[ int(group) for group in heartbeat.groups()[1:] if group ] ]
+        else: message = self.__loads(message)
+
+        timestamp = None
+
+        if isinstance(message, list):
+            if len(message) < 2:
+                return None
+
+            chan_id = message[0]
+
+            if self.watchdog is not None:
+                self.last_seen[chan_id] = now
+
+            if self.metering:
+                self.counts[chan_id] = self.counts.get(chan_id, 0) + 1
+
+            if self.trailing and self.__trailing(message) >= self.timestamps + self.sequencing:
+                if self.timestamps:
+                    timestamp = message.pop()
+
+                if self.sequencing:
+                    self.__sequence(chan_id, message.pop())
+
+            if message[1] == _HEARTBEAT:
+                return None
+
+        return message, timestamp, received, time.time() if self.timestamps else None
+
+    @staticmethod
+    def __trailing(message):
+        fields = 2 if message[1] == _HEARTBEAT or not isinstance(message[1], str) else 3
+
+        for count, field in enumerate(reversed(message[fields:])):
+            if not isinstance(field, int) or isinstance(field, bool):
+                return count
+
+        return max(len(message) - fields, 0)
+
+    def __classify(self, message):
+        if not isinstance(message, list):
+            return False, None, None
+
+        chan_id, channel = message[0], self.__channels.get(message[0])
+
+        if isinstance(message[1], list):
+            if not message[1] or isinstance(message[1][0], list):
+                return False, None, chan_id
+
+            if channel in ("ticker", "status", "candles"):
+                return True, (chan_id, ), chan_id
+
+            if channel == "book":
+                return True, (chan_id, message[1][0]), chan_id
+        elif channel == "trades" and message[1] in ("te", "tu", "fte", "ftu"):
+            return True, None, chan_id
+
+        return False, None, chan_id
+
+    async def __dispatch(self, message, timestamp, received, decoded):
+        if isinstance(message, dict):
+            if message["event"] == "subscribed" and (chan_id := message["chanId"]):
+                self.pendings.pop(message["subId"], None)
+
+                self.subscriptions[chan_id], self.__channels[chan_id] = message, message["channel"]
+
+                self.registry.bind(message["subId"], chan_id)
+
+                self.handler.subscribe(chan_id, message)
+
+                self.last_seen[chan_id] = time.monotonic()
+
+                if self.timestamps:
+                    self.__latencies[chan_id] = self.latencies.setdefault(message["subId"], ChannelLatency())
+
+                self.__acknowledge(message["subId"])
+
+                if self.registry.released(message["subId"]):
+                    await self.unsubscribe(chan_id)
+            elif message["event"] == "unsubscribed" and (chan_id := message["chanId"]):
+                if message["status"] == "OK":
+                    await self.__unsubscribed(chan_id)
+            elif message["event"] == "info" and message.get("code") == 20051:
+                rcvd = websockets.frames.Close(code=1012, reason="Stop/Restart WebSocket Server (please reconnect).")
+
+                raise websockets.exceptions.ConnectionClosedError(rcvd=rcvd, sent=None)
+            elif message["event"] == "error":
+                self.event_emitter.emit("wss-error", message["code"], message["msg"])
+
+                if "subId" in message:
+                    if self.pendings.pop(message["subId"], None) is not None:
+                        self.registry.unregister(message["subId"])
+
+                    self.__acknowledge(message["subId"], failed=True)
+        elif chan_id := message[0]:
+            self.handler.handle(chan_id, *message[1:])
+
+            if timestamp is not None and (latency := self.__latencies.get(chan_id)) is not None:
+                latency.record(timestamp, received, decoded, time.time())
+
+    async def __unsubscribed(self, chan_id):
+        subscription = self.subscriptions.pop(chan_id)
+
+        self.__forget(chan_id)
+
+        if (bucket := self.resubscriptions.pop(chan_id, None)) is not None:
+            self.registry.unbind(subscription["subId"])
+
+            bucket = self.__transfer(chan_id, subscription["subId"], bucket)
+
+            await bucket.subscribe(sub_id=subscription.pop("subId"), **{ key: value \
+                for key, value in subscription.items() if key not in ("event", "chanId") })
+        else:
+            self.handler.unsubscribe(chan_id)
+
+            self.latencies.pop(subscription["subId"], None)
+
+            self.rates.pop(subscription["subId"], None)
+
+            self.registry.unregister(subscription["subId"])
+
+    def __transfer(self, chan_id, sub_id, bucket):
+        if bucket is self or not bucket.available:
+            self.handler.reset(chan_id)
+
+            return self
+
+        bucket.handler.adopt(self.handler.release(chan_id))
+
+        if sub_id in self.latencies:
+            bucket.latencies[sub_id] = self.latencies.pop(sub_id)
+
+        if sub_id in self.rates:
+            bucket.rates[sub_id] = self.rates.pop(sub_id)
+
+        return bucket
+
+    def __forget(self, chan_id):
+        self.last_seen.pop(chan_id, None)
+
+        self.counts.pop(chan_id, None)
+
+        self.sequences.pop(chan_id, None)
+
+        self.__latencies.pop(chan_id, None)
+
+        self.__channels.pop(chan_id, None)
+
+    def __sequence(self, chan_id, sequence):
+        if self.sequence is not None and sequence != self.sequence + 1:
+            self.event_emitter.emit("sequence_gap", self.sequence + 1, sequence)
+
+            if self.resubscribe_on_gap:
+                for _chan_id in list(self.subscriptions):
+                    asyncio.ensure_future(self.resubscribe(_chan_id))
+
+        self.sequence = self.sequences[chan_id] = sequence
+
+    async def __watch(self, websocket):
+        while True:
+            await asyncio.sleep(self.watchdog / 3)
+
+            now = time.monotonic()
+
+            if now - self.last_received > self.watchdog:
+                for subscription in self.subscriptions.values():
+                    self.event_emitter.emit("stale", subscription)
+
+                return websocket.transport.abort()
+
+            for chan_id, last_seen in list(self.last_seen.items()):
+                if chan_id not in self.subscriptions:
+                    del self.last_seen[chan_id]
+                elif now - last_seen > self.watchdog and chan_id not in self.resubscriptions:
+                    self.event_emitter.emit("stale", self.subscriptions[chan_id])
+
+                    await self.resubscribe(chan_id)
+
+    def __acknowledge(self, sub_id, failed = False):
+        if self.recovery is not None and self.recovery.ack(sub_id, failed):
+            self.event_emitter.emit("recovered", self.recovery)
+
     async def __recover_state(self):
-        for pending in self.pendings:
-            await self.websocket.send(json.dumps(pending))
+        for chan_id in [ chan_id for chan_id, bucket in self.resubscriptions.items() if bucket is None ]:
+            await self.__unsubscribed(chan_id)
+
+        for chan_id, subscription in self.subscriptions.items():
+            self.handler.reset(chan_id)
+
+            self.__forget(chan_id)
 
-        for _, subscription in self.subscriptions.items():
-            await self.subscribe(sub_id=subscription.pop("subId"), **subscription)
+            self.registry.unbind(sub_id := subscription["subId"])
+
+            self.pendings[sub_id] = { **{ key: value for key, value in subscription.items() \
+                if key not in ("event", "chanId") }, "event": "subscribe" }
 
         self.subscriptions.clear()
 
+        self.resubscriptions.clear()
+
+        if (pendings := list(self.pendings.values())):
+            self.recovery = Recovery([ pending["subId"] for pending in pendings ])
+
+        try:
+            for pending in pendings:
+                await self.__send(pending)
+        except websockets.exceptions.ConnectionClosed:
+            pass
+
+    async def __send(self, frame):
+        if self.limiter is not None:
+            await self.limiter.acquire()
+
+        await self.websocket.send(json.dumps(frame))
+
     @_require_websocket_connection
-    async def subscribe(self, channel, sub_id=None, **kwargs):
+    async def subscribe(self, channel, sub_id=None, conflate=None, **kwargs):
         if len(self.subscriptions) + len(self.pendings) == BfxWebSocketBucket.MAXIMUM_SUBSCRIPTIONS_AMOUNT:
             raise TooManySubscriptions("The client has reached the maximum number of subscriptions.")
 
@@ -92,22 +396,65 @@ class BfxWebSocketBucket:
             "subId": sub_id or str(uuid.uuid4()),
         }
 
-        self.pendings.append(subscription)
+        if conflate is not None:
+            self.handler.prepare(subscription["subId"], conflate)
+
+        self.registry.register(subscription["subId"], SubscriptionRegistry.key(channel, conflate, **kwargs), self)
 
-        await self.websocket.send(json.dumps(subscription))
+        self.pendings[subscription["subId"]] = subscription
+
+        await self.__send(subscription)
 
     @_require_websocket_connection
     async def unsubscribe(self, chan_id):
+        pending, self.resubscriptions[chan_id] = chan_id in self.resubscriptions, None
+
+        if not pending:
+            await self.__unsubscribe(chan_id)
+
+    async def __unsubscribe(self, chan_id):
         await self.websocket.send(json.dumps({
             "event": "unsubscribe",
             "chanId": chan_id
         }))
 
     @_require_websocket_connection
+    async def resubscribe(self, chan_id):
+        await self.migrate(chan_id, self)
+
+    @_require_websocket_connection
+    async def migrate(self, chan_id, bucket):
+        if chan_id not in self.resubscriptions:
+            self.resubscriptions[chan_id] = bucket
+
+            await self.__unsubscribe(chan_id)
+
+    @property
+    def available(self):
+        return self.websocket is not None and self.websocket.open and \
+            len(self.subscriptions) + len(self.pendings) < BfxWebSocketBucket.MAXIMUM_SUBSCRIPTIONS_AMOUNT
+
+    def meter(self, interval, alpha):
+        counts, self.counts = self.counts, {}
+
+        for chan_id, subscription in self.subscriptions.items():
+            rate, sub_id = counts.get(chan_id, 0) / interval, subscription["subId"]
+
+            self.rates[sub_id] = alpha * rate + (1 - alpha) * self.rates.get(sub_id, rate)
+
+        return sum(counts.values()) / interval
+
     async def close(self, code=1000, reason=str()):
-        await self.websocket.close(code=code, reason=reason)
+        self.__closing = True
+
+        if self.websocket is not None and self.websocket.open:
+            await self.websocket.close(code=code, reason=reason)
+
+    def get_latest(self, sub_id):
+        return self.handler.get_latest(sub_id)
 
     def get_chan_id(self, sub_id):
-        for subscription in self.subscriptions.values():
-            if subscription["subId"] == sub_id:
-                return subscription["chanId"]
+        if self.registry.get_bucket(sub_id) is self:
+            return self.registry.get_chan_id(sub_id)
+
+        return None
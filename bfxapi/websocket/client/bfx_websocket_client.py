@@ -4,19 +4,24 @@ from collections import namedtuple
 
 from datetime import datetime
 
-import traceback, json, asyncio, hmac, hashlib, time, socket, random, websockets
+import traceback, json, asyncio, hmac, hashlib, time, socket, uuid, websockets
 
 from pyee.asyncio import AsyncIOEventEmitter
 
-from .bfx_websocket_bucket import _HEARTBEAT, F, _require_websocket_connection, BfxWebSocketBucket
+from .bfx_websocket_bucket import _HEARTBEAT, _HEARTBEAT_SUFFIX, _HEARTBEAT_FRAME, F, \
+    _require_websocket_connection, _Delay, BfxWebSocketBucket
 
 from .bfx_websocket_inputs import BfxWebSocketInputs
+from .bfx_websocket_workers import BfxWebSocketWorkers
 from ..handlers import PublicChannelsHandler, AuthenticatedEventsHandler
+from ..registry import SubscriptionRegistry
 from ..exceptions import WebSocketAuthenticationRequired, InvalidAuthenticationCredentials, EventNotSupported, \
     ZeroConnectionsError, ReconnectionTimeoutError, OutdatedClientVersion
 
 from ...utils.json_encoder import JSONEncoder
 
+from ...utils.json_decoder import get_json_loads
+
 from ...utils.logger import ColorLogger, FileLogger
 
 def _require_websocket_authentication(function: F) -> F:
@@ -29,27 +34,6 @@ def _require_websocket_authentication(function: F) -> F:
 
     return cast(F, wrapper)
 
-class _Delay:
-    BACKOFF_MIN, BACKOFF_MAX = 1.92, 60.0
-
-    BACKOFF_INITIAL = 5.0
-
-    def __init__(self, backoff_factor):
-        self.__backoff_factor = backoff_factor
-        self.__backoff_delay = _Delay.BACKOFF_MIN
-        self.__initial_delay = random.random() * _Delay.BACKOFF_INITIAL
-
-    def next(self):
-        backoff_delay = self.peek()
-        __backoff_delay = self.__backoff_delay * self.__backoff_factor
-        self.__backoff_delay = min(__backoff_delay, _Delay.BACKOFF_MAX)
-
-        return backoff_delay
-
-    def peek(self):
-        return (self.__backoff_delay == _Delay.BACKOFF_MIN) \
-            and self.__initial_delay or self.__backoff_delay
-
 class BfxWebSocketClient:
     VERSION = BfxWebSocketBucket.VERSION
 
@@ -61,22 +45,30 @@ class BfxWebSocketClient:
     ]
 
     EVENTS = [
-        "subscribed", "wss-error",
+        "subscribed", "wss-error", "sequence_gap", "recovered", "stale",
         *ONCE_EVENTS,
         *PublicChannelsHandler.EVENTS,
         *AuthenticatedEventsHandler.ON_EVENTS
     ]
 
-    def __init__(self, host, credentials, *, wss_timeout = 60 * 15, log_filename = None, log_level = "INFO"):
+    def __init__(self, host, credentials, *, wss_timeout = 60 * 15, log_filename = None, log_level = "INFO",
+                 flags = 0, resubscribe_on_gap = False, pipeline = None, limiter = None, watchdog = None,
+                 balancer = None, compact = False, lazy = False, json_backend = "json"):
         self.websocket, self.authentication, self.buckets = None, False, []
 
-        self.host, self.credentials, self.wss_timeout = host, credentials, wss_timeout
+        self.host, self.credentials, self.wss_timeout, self.compact = host, credentials, wss_timeout, compact
 
-        self.events_per_subscription = {}
+        self.flags, self.resubscribe_on_gap, self.pipeline = flags, resubscribe_on_gap, pipeline
+
+        self.limiter, self.watchdog, self.balancer = limiter, watchdog, balancer
+
+        self.registry = SubscriptionRegistry()
+
+        self.json_backend, self.__loads = json_backend, get_json_loads(json_backend)
 
         self.event_emitter = AsyncIOEventEmitter()
 
-        self.handler = AuthenticatedEventsHandler(event_emitter=self.event_emitter)
+        self.handler = AuthenticatedEventsHandler(event_emitter=self.event_emitter, lazy=lazy)
 
         self.inputs = BfxWebSocketInputs(handle_websocket_input=self.__handle_websocket_input)
 
@@ -89,10 +81,10 @@ class BfxWebSocketClient:
                 str().join(traceback.format_exception(type(exception), exception, exception.__traceback__))[:-1])
         )
 
-    def run(self, connections = 5):
-        return asyncio.run(self.start(connections))
+    def run(self, connections = 5, processes = 0):
+        return asyncio.run(self.start(connections, processes))
 
-    async def start(self, connections = 5):
+    async def start(self, connections = 5, processes = 0):
         if connections == 0:
             self.logger.info("With connections set to 0 it will not be possible to subscribe to any public channel. " \
                     "Attempting a subscription will cause a ZeroConnectionsError to be thrown.")
@@ -102,10 +94,32 @@ class BfxWebSocketClient:
                     f"buckets from the same connection ({connections} in use), the server could momentarily " \
                         "block the client with <429 Too Many Requests>.")
 
-        for _ in range(connections):
-            self.buckets += [BfxWebSocketBucket(self.host, self.event_emitter, self.events_per_subscription)]
+        if processes > 0:
+            workers = BfxWebSocketWorkers(self.host, self.event_emitter, connections=connections,
+                processes=min(processes, connections), registry=self.registry, logger=self.logger, flags=self.flags,
+                    resubscribe_on_gap=self.resubscribe_on_gap, pipeline=self.pipeline, limiter=self.limiter,
+                        watchdog=self.watchdog, compact=self.compact, json_backend=self.json_backend)
+
+            self.buckets = workers.buckets
+
+            workers.start()
+
+        for _ in range(connections if processes <= 0 else 0):
+            self.buckets += [BfxWebSocketBucket(self.host, self.event_emitter,
+                flags=self.flags, resubscribe_on_gap=self.resubscribe_on_gap, pipeline=self.pipeline,
+                    limiter=self.limiter, watchdog=self.watchdog, metering=self.balancer is not None,
+                        registry=self.registry, logger=self.logger, compact=self.compact,
+                            json_backend=self.json_backend)]
+
+        if self.balancer is None or processes > 0:
+            return await self.__connect()
 
-        await self.__connect()
+        balancer = asyncio.create_task(self.balancer.run(self.buckets))
+
+        try:
+            return await self.__connect()
+        finally:
+            balancer.cancel()
 
     #pylint: disable-next=too-many-statements,too-many-branches
     async def __connect(self):
@@ -135,19 +149,21 @@ class BfxWebSocketClient:
 
                 self.websocket = websocket
 
-                coroutines = [ BfxWebSocketBucket.connect(bucket) for bucket in self.buckets ]
+                if not tasks:
+                    tasks = [ asyncio.create_task(bucket.connect()) for bucket in self.buckets ]
 
-                tasks = [ asyncio.create_task(coroutine) for coroutine in coroutines ]
+                    await asyncio.gather(*[ bucket.on_open_event.wait() for bucket in self.buckets ])
 
-                if len(self.buckets) == 0 or \
-                        (await asyncio.gather(*[bucket.on_open_event.wait() for bucket in self.buckets])):
-                    self.event_emitter.emit("open")
+                self.event_emitter.emit("open")
 
                 if self.credentials:
                     await self.__authenticate(**self.credentials)
 
                 async for message in websocket:
-                    message = json.loads(message)
+                    if message.endswith(_HEARTBEAT_SUFFIX) and _HEARTBEAT_FRAME.fullmatch(message):
+                        continue
+
+                    message = self.__loads(message)
 
                     if isinstance(message, dict):
                         if message["event"] == "info" and "version" in message:
@@ -196,9 +212,6 @@ class BfxWebSocketClient:
                             self.logger.info("WSS server is about to restart, clients need " \
                                 "to reconnect (server sent 20051). Reconnection attempt in progress...")
 
-                        for task in tasks:
-                            task.cancel()
-
                         reconnection = Reconnection(status=True, attempts=1, timestamp=datetime.now())
 
                         if self.wss_timeout is not None:
@@ -236,20 +249,51 @@ class BfxWebSocketClient:
 
         await self.websocket.send(json.dumps(data))
 
-    async def subscribe(self, channel, **kwargs):
+    async def subscribe(self, channel, sub_id=None, conflate=None, **kwargs):
         if len(self.buckets) == 0:
             raise ZeroConnectionsError("Unable to subscribe: the number of connections must be greater than 0.")
 
-        counters = [ len(bucket.pendings) + len(bucket.subscriptions) for bucket in self.buckets ]
+        sub_id = sub_id or str(uuid.uuid4())
+
+        if (_sub_id := self.registry.find(SubscriptionRegistry.key(channel, conflate, **kwargs))) is not None:
+            if _sub_id != sub_id:
+                self.registry.alias(_sub_id, sub_id)
+
+            return sub_id
+
+        if self.balancer is not None:
+            index = self.balancer.choose(self.buckets)
+        else:
+            counters = [ len(bucket.pendings) + len(bucket.subscriptions) for bucket in self.buckets ]
+
+            index = counters.index(min(counters))
 
-        index = counters.index(min(counters))
+        await self.buckets[index].subscribe(channel, sub_id=sub_id, conflate=conflate, **kwargs)
 
-        await self.buckets[index].subscribe(channel, **kwargs)
+        return sub_id
 
     async def unsubscribe(self, sub_id):
-        for bucket in self.buckets:
-            if (chan_id := bucket.get_chan_id(sub_id)):
-                await bucket.unsubscribe(chan_id=chan_id)
+        if (bucket := self.registry.get_bucket(sub_id)) is not None \
+                and (sub_id := self.registry.release(sub_id)) is not None \
+                    and (chan_id := self.registry.get_chan_id(sub_id)) is not None:
+            await bucket.unsubscribe(chan_id=chan_id)
+
+    async def resubscribe(self, sub_id):
+        if (bucket := self.registry.get_bucket(sub_id)) is not None \
+                and (chan_id := self.registry.get_chan_id(sub_id)) is not None:
+            await bucket.resubscribe(chan_id=chan_id)
+
+    def get_latest(self, sub_id):
+        if (bucket := self.registry.get_bucket(sub_id)) is not None:
+            return bucket.get_latest(self.registry.resolve(sub_id))
+
+        return None
+
+    def get_latencies(self):
+        return { sub_id: latency for bucket in self.buckets for sub_id, latency in bucket.latencies.items() }
+
+    def get_recoveries(self):
+        return [ bucket.recovery for bucket in self.buckets ]
 
     async def close(self, code=1000, reason=str()):
         for bucket in self.buckets:
@@ -0,0 +1,210 @@
+import asyncio, multiprocessing, threading, uuid, traceback
+
+from .bfx_websocket_bucket import BfxWebSocketBucket
+
+from ..registry import SubscriptionRegistry
+
+from ..exceptions import ConnectionNotOpen, TooManySubscriptions
+
+_OPEN, _CLOSED, _UNREGISTERED, _ERROR, _LOG = "__open", "__closed", "__unregistered", "__error", "__log"
+
+class _ForwardingEventEmitter:
+    def __init__(self, queue, index):
+        self.__queue, self.__index, self.__batch = queue, index, []
+
+    def emit(self, event, *args):
+        if not self.__batch:
+            asyncio.get_running_loop().call_soon(self.__flush)
+
+        self.__batch.append((event, args))
+
+    def __flush(self):
+        batch, self.__batch = self.__batch, []
+
+        self.__queue.put((self.__index, batch))
+
+class _ForwardingLogger:
+    def __init__(self, event_emitter):
+        self.__event_emitter = event_emitter
+
+    def warning(self, message):
+        self.__event_emitter.emit(_LOG, "warning", message)
+
+class _ForwardingRegistry(SubscriptionRegistry):
+    """Notifies the main process of the subIds dropped by the buckets of a worker (e.g. rejected subscriptions)."""
+
+    def unregister(self, sub_id):
+        if (bucket := self.get_bucket(sub_id)) is not None:
+            bucket.event_emitter.emit(_UNREGISTERED, sub_id)
+
+        super().unregister(sub_id)
+
+async def _serve(host, indexes, options, commands, events):
+    registry = _ForwardingRegistry()
+
+    emitters = { index: _ForwardingEventEmitter(events, index) for index in indexes }
+
+    buckets = { index: BfxWebSocketBucket(host, emitters[index], registry=registry,
+        logger=_ForwardingLogger(emitters[index]), **options) for index in indexes }
+
+    closing = { index: asyncio.Event() for index in indexes }
+
+    async def _notify(index, bucket):
+        await bucket.on_open_event.wait()
+
+        events.put((index, [ (_OPEN, ()) ]))
+
+    async def _connect(index, bucket):
+        notification = asyncio.create_task(_notify(index, bucket))
+
+        try:
+            await bucket.connect()
+        #pylint: disable-next=broad-except
+        except Exception:
+            events.put((index, [ (_ERROR, (traceback.format_exc(), )) ]))
+        finally:
+            notification.cancel()
+
+        closing[index].set()
+
+        events.put((index, [ (_CLOSED, ()) ]))
+
+    async def _receive():
+        loop = asyncio.get_running_loop()
+
+        while any(not event.is_set() for event in closing.values()):
+            command, index, *args = await loop.run_in_executor(None, commands.get)
+
+            try:
+                if command == "close":
+                    closing[index].set()
+
+                    await buckets[index].close(*args)
+                elif command == "subscribe":
+                    await buckets[index].subscribe(**args[0])
+                elif (chan_id := buckets[index].get_chan_id(args[0])):
+                    await getattr(buckets[index], command)(chan_id)
+                elif command == "unsubscribe":
+                    registry.release(args[0])
+            except ConnectionNotOpen:
+                pass
+
+    await asyncio.gather(_receive(), *[ _connect(index, bucket) for index, bucket in buckets.items() ])
+
+def _work(host, indexes, options, commands, events):
+    asyncio.run(_serve(host, indexes, options, commands, events))
+
+class _RemoteBucket:
+    """Stand-in for a BfxWebSocketBucket running in a worker process, which identifies channels by subId."""
+
+    def __init__(self, index, commands, registry):
+        self.__index, self.__commands, self.registry = index, commands, registry
+
+        self.subscriptions, self.pendings, self.latencies, self.recovery = {}, {}, {}, None
+
+        self.rates = {}
+
+        self.on_open_event, self.__closed = asyncio.locks.Event(), asyncio.locks.Event()
+
+    def receive(self, event, args):
+        if event == _OPEN:
+            self.on_open_event.set()
+        elif event == _CLOSED:
+            self.__closed.set()
+        elif event == "subscribed":
+            self.pendings.pop(sub_id := args[0]["subId"], None)
+
+            self.subscriptions[sub_id] = args[0]
+
+            self.registry.bind(sub_id, sub_id)
+
+            if self.registry.released(sub_id):
+                self.__unsubscribe(sub_id)
+        elif event == _UNREGISTERED:
+            if self.pendings.pop(sub_id := args[0], None) is not None \
+                    or self.subscriptions.pop(sub_id, None) is not None:
+                self.registry.unregister(sub_id)
+        elif event == "recovered":
+            self.recovery = args[0]
+
+    async def connect(self):
+        await self.__closed.wait()
+
+    async def subscribe(self, channel, sub_id=None, conflate=None, **kwargs):
+        if len(self.subscriptions) + len(self.pendings) == BfxWebSocketBucket.MAXIMUM_SUBSCRIPTIONS_AMOUNT:
+            raise TooManySubscriptions("The client has reached the maximum number of subscriptions.")
+
+        self.pendings[sub_id := sub_id or str(uuid.uuid4())] = { "subId": sub_id }
+
+        self.registry.register(sub_id, SubscriptionRegistry.key(channel, conflate, **kwargs), self)
+
+        self.__commands.put(("subscribe", self.__index,
+            { **kwargs, "channel": channel, "sub_id": sub_id, "conflate": conflate }))
+
+    async def unsubscribe(self, chan_id):
+        self.__unsubscribe(chan_id)
+
+    def __unsubscribe(self, chan_id):
+        self.subscriptions.pop(chan_id, None)
+
+        self.registry.unregister(chan_id)
+
+        self.__commands.put(("unsubscribe", self.__index, chan_id))
+
+    async def resubscribe(self, chan_id):
+        self.__commands.put(("resubscribe", self.__index, chan_id))
+
+    async def close(self, code=1000, reason=str()):
+        self.__commands.put(("close", self.__index, code, reason))
+
+    def get_chan_id(self, sub_id):
+        if sub_id in self.subscriptions:
+            return sub_id
+
+        return None
+
+    def get_latest(self, _sub_id):
+        return None
+
+class BfxWebSocketWorkers:
+    """Runs the buckets of a BfxWebSocketClient in a pool of worker processes."""
+
+    def __init__(self, host, event_emitter, *, connections, processes, registry, logger, **options):
+        self.__event_emitter, self.__logger, context = event_emitter, logger, multiprocessing.get_context("spawn")
+
+        self.__events, self.__processes, buckets = context.Queue(), [], {}
+
+        for process in range(processes):
+            indexes, commands = list(range(process, connections, processes)), context.Queue()
+
+            self.__processes.append(context.Process(target=_work, daemon=True,
+                args=(host, indexes, options, commands, self.__events)))
+
+            buckets.update({ index: _RemoteBucket(index, commands, registry) for index in indexes })
+
+        self.buckets = [ buckets[index] for index in range(connections) ]
+
+    def start(self):
+        loop = asyncio.get_running_loop()
+
+        for process in self.__processes:
+            process.start()
+
+        def _pump():
+            while (batch := self.__events.get()) is not None:
+                loop.call_soon_threadsafe(self.__receive, *batch)
+
+        threading.Thread(target=_pump, daemon=True).start()
+
+    def __receive(self, index, batch):
+        bucket = self.buckets[index]
+
+        for event, args in batch:
+            if event == _ERROR:
+                self.__logger.error(f"Bucket no.{index} stopped on an unexpected error:\n{args[0].rstrip()}")
+            elif event == _LOG:
+                getattr(self.__logger, args[0])(args[1])
+            else: bucket.receive(event, args)
+
+            if event not in (_OPEN, _CLOSED, _UNREGISTERED, _ERROR, _LOG):
+                self.__event_emitter.emit(event, *args)
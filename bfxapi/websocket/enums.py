@@ -7,3 +7,9 @@ class Channel(str, Enum):
     BOOK = "book"
     CANDLES = "candles"
     STATUS = "status"
+
+class ConfFlag(int, Enum):
+    TIMESTAMP = 32768
+    SEQ_ALL = 65536
+    OB_CHECKSUM = 131072
+    BULK_UPDATES = 536870912
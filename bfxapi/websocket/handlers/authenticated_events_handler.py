@@ -42,8 +42,8 @@ class AuthenticatedEventsHandler:
         "oc-req-notification", "fon-req-notification", "foc-req-notification"
     ]
 
-    def __init__(self, event_emitter):
-        self.event_emitter = event_emitter
+    def __init__(self, event_emitter, lazy = False):
+        self.event_emitter, self.lazy = event_emitter, lazy
 
     def handle(self, abbrevation, stream):
         if abbrevation == "n":
@@ -51,12 +51,13 @@ class AuthenticatedEventsHandler:
 
         for abbrevations, serializer in AuthenticatedEventsHandler.__serializers.items():
             if abbrevation in abbrevations:
-                event = AuthenticatedEventsHandler.__abbreviations[abbrevation]
+                event, parse = AuthenticatedEventsHandler.__abbreviations[abbrevation], \
+                    self.lazy and serializer.parse_lazy or serializer.parse
 
                 if all(isinstance(substream, list) for substream in stream):
-                    return self.event_emitter.emit(event, [ serializer.parse(*substream) for substream in stream ])
+                    return self.event_emitter.emit(event, [ parse(*substream) for substream in stream ])
 
-                return self.event_emitter.emit(event, serializer.parse(*stream))
+                return self.event_emitter.emit(event, parse(*stream))
 
     def __notification(self, stream):
         event, serializer = "notification", _Notification(serializer=None)
@@ -1,5 +1,19 @@
+import asyncio, time
+
 from ...types import serializers
 
+_CHECKSUM = "cs"
+
+_PULL = "pull"
+
+class _SubscriptionState:
+    __slots__ = ("sub_id", "snapshot", "subscribed", "conflate", "timer", "parse", "latest")
+
+    def __init__(self, sub_id, conflate = None):
+        self.sub_id, self.snapshot, self.subscribed, self.conflate = sub_id, False, False, conflate
+
+        self.timer, self.parse, self.latest = None, None, None
+
 class PublicChannelsHandler:
     ONCE_PER_SUBSCRIPTION_EVENTS = [
         "t_trades_snapshot", "f_trades_snapshot", "t_book_snapshot", 
@@ -12,12 +26,16 @@ class PublicChannelsHandler:
         "t_ticker_update", "f_ticker_update", "t_trade_execution", 
         "t_trade_execution_update", "f_trade_execution", "f_trade_execution_update", 
         "t_book_update", "f_book_update", "t_raw_book_update", 
-        "f_raw_book_update", "candles_update", "derivatives_status_update"
+        "f_raw_book_update", "candles_update", "derivatives_status_update",
+        "t_book_checksum", "f_book_checksum", "t_raw_book_checksum",
+        "f_raw_book_checksum", "t_book_batch_update", "f_book_batch_update",
+        "t_raw_book_batch_update", "f_raw_book_batch_update"
     ]
 
-    def __init__(self, event_emitter, events_per_subscription):
-        self.__event_emitter, self.__events_per_subscription = \
-            event_emitter, events_per_subscription
+    def __init__(self, event_emitter, compact = False):
+        self.__event_emitter, self.__compact = event_emitter, compact
+
+        self.__dispatchers, self.__channels, self.__states = { }, { }, { }
 
         self.__handlers = {
             "ticker": self.__ticker_channel_handler,
@@ -27,113 +45,228 @@ class PublicChannelsHandler:
             "status": self.__status_channel_handler
         }
 
-    def handle(self, subscription, *stream):
-        #pylint: disable-next=unnecessary-lambda-assignment
-        _clear = lambda dictionary, *args: { key: value for key, value in dictionary.items() if key not in args }
+    def prepare(self, sub_id, conflate):
+        if (state := self.__states.get(sub_id)) is None:
+            state = self.__states[sub_id] = _SubscriptionState(sub_id)
+
+        state.conflate = conflate
+
+    def subscribe(self, chan_id, subscription):
+        if (state := self.__states.get(sub_id := subscription["subId"])) is None:
+            state = self.__states[sub_id] = _SubscriptionState(sub_id)
+
+        if not state.subscribed:
+            state.subscribed = True
+
+            self.__event_emitter.emit("subscribed", subscription)
+
+        self.__channels[chan_id] = state
+
+        sub = { key: value for key, value in subscription.items() if key not in ("event", "channel", "chanId") }
+
+        if (channel := subscription["channel"]) in self.__handlers:
+            if (dispatcher := self.__handlers[channel](sub, state)) is not None:
+                self.__dispatchers[chan_id] = dispatcher
+
+    def detach(self, chan_id):
+        self.__dispatchers.pop(chan_id, None)
+
+        if (state := self.__channels.pop(chan_id, None)) is not None and state.timer is not None:
+            state.timer.cancel()
+
+            state.timer = None
+
+        return state
+
+    def unsubscribe(self, chan_id):
+        if (state := self.detach(chan_id)) is not None:
+            del self.__states[state.sub_id]
+
+    def reset(self, chan_id):
+        if (state := self.detach(chan_id)) is not None:
+            state.snapshot = False
+
+        return state
+
+    def release(self, chan_id):
+        if (state := self.reset(chan_id)) is not None:
+            del self.__states[state.sub_id]
+
+        return state
+
+    def adopt(self, state):
+        if state is not None:
+            self.__states[state.sub_id] = state
+
+    def handle(self, chan_id, *stream):
+        if (dispatcher := self.__dispatchers.get(chan_id)) is not None:
+            return dispatcher(*stream)
+
+    def get_latest(self, sub_id):
+        if (state := self.__states.get(sub_id)) is not None and state.latest is not None:
+            return state.parse(*state.latest)
+
+        return None
+
+    def __conflated(self, state, event, subscription, parse):
+        emit = self.__event_emitter.emit
+
+        def _emit(data):
+            return emit(event, subscription, parse(*data))
+
+        if state.conflate is None:
+            return _emit
+
+        if state.conflate == _PULL:
+            state.parse = parse
+
+            def _store(data):
+                state.latest = data
+
+            return _store
+
+        interval, emitted, pending = state.conflate, 0.0, None
+
+        def _flush():
+            nonlocal emitted, pending
+
+            emitted, data, pending, state.timer = time.monotonic(), pending, None, None
+
+            _emit(data)
+
+        def _update(data):
+            nonlocal emitted, pending
+
+            if pending is None:
+                if (now := time.monotonic()) - emitted >= interval:
+                    emitted = now
 
-        #pylint: disable-next=consider-iterating-dictionary
-        if (channel := subscription["channel"]) and channel in self.__handlers.keys():
-            return self.__handlers[channel](_clear(subscription, "event", "channel", "chanId"), *stream)
+                    return _emit(data)
 
-    def __emit(self, event, sub, data):
-        sub_id, should_emit_event = sub["subId"], True
+                state.timer = asyncio.get_running_loop().call_later(emitted + interval - now, _flush)
 
-        if event in PublicChannelsHandler.ONCE_PER_SUBSCRIPTION_EVENTS:
-            if sub_id not in self.__events_per_subscription:
-                self.__events_per_subscription[sub_id] = [ event ]
-            elif event not in self.__events_per_subscription[sub_id]:
-                self.__events_per_subscription[sub_id] += [ event ]
-            else: should_emit_event = False
+            pending = data
+
+            return None
+
+        return _update
+
+    def __serializer(self, serializer):
+        return self.__compact and serializer.compact or serializer
+
+    def __emit_snapshot(self, state, event, sub, data):
+        if not state.snapshot:
+            state.snapshot = True
 
-        if should_emit_event:
             return self.__event_emitter.emit(event, sub, data)
 
-    def __ticker_channel_handler(self, subscription, *stream):
+    def __ticker_channel_handler(self, subscription, state):
         if subscription["symbol"].startswith("t"):
-            return self.__emit(
-                "t_ticker_update",
-                subscription,
-                serializers.TradingPairTicker.parse(*stream[0])
-            )
-
-        if subscription["symbol"].startswith("f"):
-            return self.__emit(
-                "f_ticker_update",
-                subscription,
-                serializers.FundingCurrencyTicker.parse(*stream[0])
-            )
-
-    def __trades_channel_handler(self, subscription, *stream):
-        if (event := stream[0]) and event in [ "te", "tu", "fte", "ftu" ]:
-            if subscription["symbol"].startswith("t"):
-                return self.__emit(
-                    { "te": "t_trade_execution", "tu": "t_trade_execution_update" }[event],
-                    subscription,
-                    serializers.TradingPairTrade.parse(*stream[1])
-                )
-
-            if subscription["symbol"].startswith("f"):
-                return self.__emit(
-                    { "fte": "f_trade_execution", "ftu": "f_trade_execution_update" }[event],
-                    subscription,
-                    serializers.FundingCurrencyTrade.parse(*stream[1])
-                )
+            event, serializer = "t_ticker_update", serializers.TradingPairTicker
+        elif subscription["symbol"].startswith("f"):
+            event, serializer = "f_ticker_update", serializers.FundingCurrencyTicker
+        else: return None
+
+        emit, parse = self.__event_emitter.emit, self.__serializer(serializer).parse
 
+        if state.conflate is not None:
+            update = self.__conflated(state, event, subscription, parse)
+
+            return lambda *stream: update(stream[0])
+
+        def _handler(*stream):
+            return emit(event, subscription, parse(*stream[0]))
+
+        return _handler
+
+    def __trades_channel_handler(self, subscription, state):
         if subscription["symbol"].startswith("t"):
-            return self.__emit(
-                "t_trades_snapshot",
-                subscription,
-                [ serializers.TradingPairTrade.parse(*substream) for substream in stream[0] ]
-            )
-
-        if subscription["symbol"].startswith("f"):
-            return self.__emit(
-                "f_trades_snapshot",
-                subscription,
-                [ serializers.FundingCurrencyTrade.parse(*substream)  for substream in stream[0] ]
-            )
-
-    def __book_channel_handler(self, subscription, *stream):
-        event = subscription["symbol"][0]
+            events, snapshot, serializer = { "te": "t_trade_execution", "tu": "t_trade_execution_update" }, \
+                "t_trades_snapshot", serializers.TradingPairTrade
+        elif subscription["symbol"].startswith("f"):
+            events, snapshot, serializer = { "fte": "f_trade_execution", "ftu": "f_trade_execution_update" }, \
+                "f_trades_snapshot", serializers.FundingCurrencyTrade
+        else: return None
+
+        emit, serializer = self.__event_emitter.emit, self.__serializer(serializer)
 
+        def _handler(*stream):
+            if isinstance(event := stream[0], str):
+                if event in events:
+                    return emit(events[event], subscription, serializer.parse(*stream[1]))
+
+                return None
+
+            return self.__emit_snapshot(state, snapshot, subscription, serializer.parse_many(stream[0]))
+
+        return _handler
+
+    def __book_channel_handler(self, subscription, state):
         if subscription["prec"] == "R0":
-            _trading_pair_serializer, _funding_currency_serializer, is_raw_book = \
-                serializers.TradingPairRawBook, serializers.FundingCurrencyRawBook, True
-        else: _trading_pair_serializer, _funding_currency_serializer, is_raw_book = \
-                serializers.TradingPairBook, serializers.FundingCurrencyBook, False
-
-        if all(isinstance(substream, list) for substream in stream[0]):
-            return self.__emit(
-                event + "_" + (is_raw_book and "raw_book" or "book") + "_snapshot",
-                subscription,
-                [ { "t": _trading_pair_serializer, "f": _funding_currency_serializer }[event] \
-                    .parse(*substream) for substream in stream[0] ]
-            )
-
-        return self.__emit(
-            event + "_" + (is_raw_book and "raw_book" or "book") + "_update",
-            subscription,
-            { "t": _trading_pair_serializer, "f": _funding_currency_serializer }[event].parse(*stream[0])
-        )
-
-    def __candles_channel_handler(self, subscription, *stream):
-        if all(isinstance(substream, list) for substream in stream[0]):
-            return self.__emit(
-                "candles_snapshot", 
-                subscription,
-                [ serializers.Candle.parse(*substream) for substream in stream[0] ]
-            )
-
-        return self.__emit(
-            "candles_update",
-            subscription,
-            serializers.Candle.parse(*stream[0])
-        )
-
-    def __status_channel_handler(self, subscription, *stream):
-        if subscription["key"].startswith("deriv:"):
-            return self.__emit(
-                "derivatives_status_update",
-                subscription,
-                serializers.DerivativesStatus.parse(*stream[0])
-            )
+            _trading_pair_serializer, _funding_currency_serializer, kind = \
+                serializers.TradingPairRawBook, serializers.FundingCurrencyRawBook, "raw_book"
+        else: _trading_pair_serializer, _funding_currency_serializer, kind = \
+                serializers.TradingPairBook, serializers.FundingCurrencyBook, "book"
+
+        if (prefix := subscription["symbol"][0]) not in ("t", "f"):
+            return None
+
+        snapshot, update, batch_update, checksum = f"{prefix}_{kind}_snapshot", f"{prefix}_{kind}_update", \
+            f"{prefix}_{kind}_batch_update", f"{prefix}_{kind}_checksum"
+
+        emit, serializer = self.__event_emitter.emit, self.__serializer({ "t": _trading_pair_serializer,
+            "f": _funding_currency_serializer }[prefix])
+
+        received = False
+
+        def _handler(*stream):
+            nonlocal received
+
+            if stream[0] == _CHECKSUM:
+                return emit(checksum, subscription, stream[1])
+
+            if not stream[0] or isinstance(stream[0][0], list):
+                if received:
+                    emit(batch_update, subscription, data := serializer.parse_many(stream[0]))
+
+                    for item in data:
+                        emit(update, subscription, item)
+
+                    return None
+
+                received = True
+
+                return self.__emit_snapshot(state, snapshot, subscription, serializer.parse_many(stream[0]))
+
+            return emit(update, subscription, serializer.parse(*stream[0]))
+
+        return _handler
+
+    def __candles_channel_handler(self, subscription, state):
+        serializer = self.__serializer(serializers.Candle)
+
+        update = self.__conflated(state, "candles_update", subscription, serializer.parse)
+
+        def _handler(*stream):
+            if not stream[0] or isinstance(stream[0][0], list):
+                return self.__emit_snapshot(state, "candles_snapshot", subscription, serializer.parse_many(stream[0]))
+
+            return update(stream[0])
+
+        return _handler
+
+    def __status_channel_handler(self, subscription, state):
+        if not subscription["key"].startswith("deriv:"):
+            return None
+
+        emit, parse = self.__event_emitter.emit, serializers.DerivativesStatus.parse
+
+        if state.conflate is not None:
+            update = self.__conflated(state, "derivatives_status_update", subscription, parse)
+
+            return lambda *stream: update(stream[0])
+
+        def _handler(*stream):
+            return emit("derivatives_status_update", subscription, parse(*stream[0]))
+
+        return _handler
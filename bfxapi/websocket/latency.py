@@ -0,0 +1,104 @@
+from typing import List, Optional
+
+__all__ = [
+    "Histogram",
+    "ChannelLatency"
+]
+
+class Histogram:
+    """
+    Log-linear histogram of non-negative integers (à la HdrHistogram).
+
+    Values are grouped in buckets whose width grows with their magnitude, so that the
+    relative error of each recorded value is at most 2 / 2 ** precision, while both
+    recording a value and the memory used are independent of the amount of values.
+    """
+
+    def __init__(self, precision: int = 7):
+        self.__precision, self.__size = precision, 1 << precision
+
+        self.__counts: List[int] = [ ]
+
+        self.count, self.total = 0, 0
+
+        self.min: Optional[int] = None
+
+        self.max: Optional[int] = None
+
+    def __index(self, value: int) -> int:
+        if value < self.__size:
+            return value
+
+        exponent = value.bit_length() - self.__precision
+
+        return self.__size + ((exponent - 1) << (self.__precision - 1)) + (value >> exponent) - (self.__size >> 1)
+
+    def __value(self, index: int) -> int:
+        if index < self.__size:
+            return index
+
+        exponent, mantissa = divmod(index - self.__size, self.__size >> 1)
+
+        return (((mantissa + (self.__size >> 1)) + 1) << (exponent + 1)) - 1
+
+    def record(self, value: int) -> None:
+        if (index := self.__index(value := max(value, 0))) >= len(self.__counts):
+            self.__counts.extend([ 0 ] * (index + 1 - len(self.__counts)))
+
+        self.__counts[index] += 1
+
+        self.count, self.total = self.count + 1, self.total + value
+
+        if self.min is None or value < self.min:
+            self.min = value
+
+        if self.max is None or value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> Optional[float]:
+        if self.count:
+            return self.total / self.count
+
+        return None
+
+    def percentile(self, percentile: float) -> Optional[int]:
+        if not self.count:
+            return None
+
+        target, cumulative = max(1, round(self.count * percentile / 100)), 0
+
+        for index, count in enumerate(self.__counts):
+            if (cumulative := cumulative + count) >= target:
+                return min(self.__value(index), self.max or 0)
+
+        return self.max
+
+    def reset(self) -> None:
+        self.__counts.clear()
+
+        self.count, self.total, self.min, self.max = 0, 0, None, None
+
+class ChannelLatency:
+    """
+    Latency (in microseconds) of the messages of a channel, from the exchange to the
+    client (network), from the client to the decoded message (decode) and from the
+    decoded message to the return of the event handlers (dispatch).
+    """
+
+    def __init__(self):
+        self.network, self.decode, self.dispatch = Histogram(), Histogram(), Histogram()
+
+    def record(self, timestamp: int, received: float, decoded: float, dispatched: float) -> None:
+        self.network.record(int(received * 1_000_000) - timestamp * 1_000)
+
+        self.decode.record(int((decoded - received) * 1_000_000))
+
+        self.dispatch.record(int((dispatched - decoded) * 1_000_000))
+
+    def reset(self) -> None:
+        self.network.reset()
+
+        self.decode.reset()
+
+        self.dispatch.reset()
@@ -0,0 +1,450 @@
+from typing import \
+    TYPE_CHECKING, Dict, List, Tuple, Iterator, Optional, Union, Any, cast
+
+from abc import ABC, abstractmethod
+
+from bisect import bisect_left, insort
+
+from itertools import islice, zip_longest
+
+from operator import attrgetter
+
+import asyncio, zlib
+
+if TYPE_CHECKING:
+    from ..types import TradingPairBook, FundingCurrencyBook, \
+        TradingPairRawBook, FundingCurrencyRawBook
+    from .client import BfxWebSocketClient
+    from .subscriptions import Book
+
+    _Level = Union[TradingPairBook, FundingCurrencyBook, "_RawLevel"]
+
+    _RawOrder = Union[TradingPairRawBook, FundingCurrencyRawBook]
+
+__all__ = [
+    "OrderBook",
+    "OrderBooks",
+
+    "RawOrderBook",
+    "RawOrderBooks"
+]
+
+def _format_number(number: float) -> str:
+    if isinstance(number, int):
+        return str(number)
+
+    if number.is_integer() and abs(number) < 1e21:
+        return str(int(number))
+
+    if "e" not in (text := repr(number)):
+        return text
+
+    mantissa, exponent = text.split("e")
+
+    if int(exponent) >= -6:
+        return ("-" if number < 0 else "") + "0." + "0" * (-int(exponent) - 1) + \
+            mantissa.lstrip("-").replace(".", "")
+
+    return f"{mantissa}e{int(exponent):+d}"
+
+def _checksum(bids: Iterator[str], asks: Iterator[str]) -> int:
+    values: List[str] = [ ]
+
+    for bid, ask in zip_longest(bids, asks):
+        if bid is not None:
+            values.append(bid)
+
+        if ask is not None:
+            values.append(ask)
+
+    checksum = zlib.crc32(":".join(values).encode("utf8"))
+
+    return checksum - (1 << 32) if checksum & 0x80000000 else checksum
+
+class _BookSide:
+    """One side of an order book, sorted so that the best level is always at the end of the key list."""
+
+    def __init__(self, descending: bool):
+        self.__sign = 1 if descending else -1
+
+        self.__keys: List[float] = [ ]
+
+        self.__levels: Dict[float, "_Level"] = { }
+
+        self.__amount = 0.0
+
+    def __len__(self) -> int:
+        return len(self.__keys)
+
+    def __contains__(self, price: float) -> bool:
+        return price in self.__levels
+
+    def __iter__(self) -> Iterator["_Level"]:
+        levels, sign = self.__levels, self.__sign
+
+        return (levels[key * sign] for key in reversed(self.__keys))
+
+    @property
+    def amount(self) -> float:
+        return self.__amount
+
+    def get(self, price: float) -> Optional["_Level"]:
+        return self.__levels.get(price)
+
+    def best(self) -> Optional["_Level"]:
+        if self.__keys:
+            return self.__levels[self.__keys[-1] * self.__sign]
+
+        return None
+
+    def top(self, length: int) -> List["_Level"]:
+        levels, sign = self.__levels, self.__sign
+
+        return [ levels[key * sign] for key in reversed(self.__keys[-length:]) ]
+
+    def cumulative(self, length: int) -> float:
+        return sum(abs(level.amount) for level in self.top(length))
+
+    def put(self, price: float, level: "_Level") -> None:
+        if (previous := self.__levels.get(price)) is None:
+            insort(self.__keys, price * self.__sign)
+        else: self.__amount -= abs(previous.amount)
+
+        self.__levels[price] = level
+
+        self.__amount += abs(level.amount)
+
+    def remove(self, price: float) -> None:
+        if (level := self.__levels.pop(price, None)) is not None:
+            del self.__keys[bisect_left(self.__keys, price * self.__sign)]
+
+            self.__amount -= abs(level.amount)
+
+    def adjust(self, amount: float) -> None:
+        self.__amount += amount
+
+    def clear(self) -> None:
+        self.__keys.clear()
+
+        self.__levels.clear()
+
+        self.__amount = 0.0
+
+class _RawLevel:
+    """Price level of a raw book, holding its orders in queue (i.e. arrival) order."""
+
+    __slots__ = ("price", "amount", "_orders", "_sequences", "_sequence")
+
+    def __init__(self, price: float):
+        self.price, self.amount = price, 0.0
+
+        self._orders: Dict[int, Tuple[int, "_RawOrder"]] = { }
+
+        self._sequences: List[int] = [ ]
+
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def __contains__(self, order_id: int) -> bool:
+        return order_id in self._orders
+
+    def __iter__(self) -> Iterator["_RawOrder"]:
+        return (order for _, order in self._orders.values())
+
+    @property
+    def count(self) -> int:
+        return len(self._orders)
+
+    def position(self, order_id: int) -> int:
+        return bisect_left(self._sequences, self._orders[order_id][0])
+
+    def push(self, order_id: int, order: "_RawOrder") -> None:
+        self._orders[order_id] = (self._sequence, order)
+
+        self._sequences.append(self._sequence)
+
+        self._sequence += 1
+
+        self.amount += order.amount
+
+    def replace(self, order_id: int, order: "_RawOrder") -> "_RawOrder":
+        sequence, previous = self._orders[order_id]
+
+        self._orders[order_id] = (sequence, order)
+
+        self.amount += order.amount - previous.amount
+
+        return previous
+
+    def pop(self, order_id: int) -> "_RawOrder":
+        sequence, order = self._orders.pop(order_id)
+
+        del self._sequences[bisect_left(self._sequences, sequence)]
+
+        if self._orders:
+            self.amount -= order.amount
+        else: self.amount = 0.0
+
+        return order
+
+class _BaseOrderBook(ABC):
+    CHECKSUM_DEPTH = 25
+
+    def __init__(self, *, funding: bool = False):
+        self.funding = funding
+
+        self.bids, self.asks = _BookSide(descending=True), _BookSide(descending=False)
+
+    @abstractmethod
+    def _price(self, level: "_Level") -> float:
+        ...
+
+    @abstractmethod
+    def update(self, data) -> None:
+        ...
+
+    @abstractmethod
+    def checksum(self) -> int:
+        ...
+
+    def snapshot(self, snapshot: List) -> None:
+        self.clear()
+
+        for data in snapshot:
+            self.update(data)
+
+    def clear(self) -> None:
+        self.bids.clear()
+
+        self.asks.clear()
+
+    def best_bid(self) -> Optional["_Level"]:
+        return self.bids.best()
+
+    def best_ask(self) -> Optional["_Level"]:
+        return self.asks.best()
+
+    def spread(self) -> Optional[float]:
+        if (bid := self.bids.best()) is None or (ask := self.asks.best()) is None:
+            return None
+
+        return self._price(ask) - self._price(bid)
+
+    def depth(self, length: int) -> Tuple[List["_Level"], List["_Level"]]:
+        return self.bids.top(length), self.asks.top(length)
+
+class OrderBook(_BaseOrderBook):
+    """
+    Sorted, incrementally maintained view of a P0-P4 book channel.
+
+    Updates cost O(log n) to locate a level, while the best level of each side
+    and the total amount resting on it are available in constant time.
+    """
+
+    def __init__(self, *, funding: bool = False):
+        super().__init__(funding=funding)
+
+        self.__key = attrgetter("rate" if funding else "price")
+
+        self.__strings: Dict[float, str] = { }
+
+    def _price(self, level: "_Level") -> float:
+        return self.__key(level)
+
+    def update(self, data: "_Level") -> None:
+        side = self.bids if (data.amount > 0) != self.funding else self.asks
+
+        self.__strings.pop(price := self.__key(data), None)
+
+        if data.count > 0:
+            side.put(price, data)
+        else: side.remove(price)
+
+    def clear(self) -> None:
+        super().clear()
+
+        self.__strings.clear()
+
+    def checksum(self) -> int:
+        return _checksum(map(self.__string, self.bids.top(self.CHECKSUM_DEPTH)),
+            map(self.__string, self.asks.top(self.CHECKSUM_DEPTH)))
+
+    def __string(self, level: "_Level") -> str:
+        if (string := self.__strings.get(price := self.__key(level))) is None:
+            string = self.__strings[price] = f"{_format_number(price)}:{_format_number(level.amount)}"
+
+        return string
+
+class RawOrderBook(_BaseOrderBook):
+    """
+    Incrementally maintained view of a R0 book channel, indexed by order (or offer) id.
+
+    Orders are aggregated into price levels as they arrive, so that level membership
+    and queue position of any order can be queried without scanning the book.
+    """
+
+    def __init__(self, *, funding: bool = False):
+        super().__init__(funding=funding)
+
+        self.__id, self.__key = attrgetter("offer_id" if funding else "order_id"), \
+            attrgetter("rate" if funding else "price")
+
+        self.__orders: Dict[int, Tuple[_BookSide, _RawLevel]] = { }
+
+        self.__strings: Dict[int, str] = { }
+
+    def __len__(self) -> int:
+        return len(self.__orders)
+
+    def __contains__(self, order_id: int) -> bool:
+        return order_id in self.__orders
+
+    def _price(self, level: "_Level") -> float:
+        return cast(_RawLevel, level).price
+
+    def update(self, data: "_RawOrder") -> None:
+        order_id, price = self.__id(data), self.__key(data)
+
+        side = self.bids if (data.amount > 0) != self.funding else self.asks
+
+        self.__strings.pop(order_id, None)
+
+        if (entry := self.__orders.get(order_id)) is not None:
+            if price == entry[1].price and side is entry[0]:
+                previous = entry[1].replace(order_id, data)
+
+                return side.adjust(abs(data.amount) - abs(previous.amount))
+
+            self.__remove(order_id, *entry)
+
+        if price == 0:
+            return None
+
+        if (level := cast(Optional[_RawLevel], side.get(price))) is None:
+            side.put(price, level := _RawLevel(price))
+
+        level.push(order_id, data)
+
+        side.adjust(abs(data.amount))
+
+        self.__orders[order_id] = (side, level)
+
+        return None
+
+    def __remove(self, order_id: int, side: _BookSide, level: _RawLevel) -> None:
+        side.adjust(-abs(level.pop(order_id).amount))
+
+        if not level:
+            side.remove(level.price)
+
+        del self.__orders[order_id]
+
+    def clear(self) -> None:
+        super().clear()
+
+        self.__orders.clear()
+
+        self.__strings.clear()
+
+    def checksum(self) -> int:
+        return _checksum(*[ map(self.__string, islice((order for level in side for order in cast(_RawLevel, level)), \
+            self.CHECKSUM_DEPTH)) for side in (self.bids, self.asks) ])
+
+    def __string(self, order: "_RawOrder") -> str:
+        if (string := self.__strings.get(order_id := self.__id(order))) is None:
+            string = self.__strings[order_id] = f"{order_id}:{_format_number(order.amount)}"
+
+        return string
+
+    def get(self, order_id: int) -> Optional["_RawOrder"]:
+        if (entry := self.__orders.get(order_id)) is not None:
+            return entry[1]._orders[order_id][1] #pylint: disable=protected-access
+
+        return None
+
+    def level(self, order_id: int) -> Optional[_RawLevel]:
+        if (entry := self.__orders.get(order_id)) is not None:
+            return entry[1]
+
+        return None
+
+    def position(self, order_id: int) -> Optional[int]:
+        if (entry := self.__orders.get(order_id)) is not None:
+            return entry[1].position(order_id)
+
+        return None
+
+class _OrderBooks:
+    _BOOK: type
+
+    _SNAPSHOT_EVENTS: Tuple[str, str]
+
+    _UPDATE_EVENTS: Tuple[str, str]
+
+    _CHECKSUM_EVENTS: Tuple[str, str]
+
+    def __init__(self, wss: "BfxWebSocketClient"):
+        self.__wss, self.__books = wss, cast(Dict[str, Any], { })
+
+        wss.on(*self._SNAPSHOT_EVENTS, callback=self.__on_snapshot)
+
+        wss.on(*self._UPDATE_EVENTS, callback=self.__on_update)
+
+        wss.on(*self._CHECKSUM_EVENTS, callback=self.__on_checksum)
+
+    def __getitem__(self, symbol: str) -> Any:
+        return self.__books[symbol]
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self.__books
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__books)
+
+    def __on_snapshot(self, subscription: "Book", snapshot: List) -> None:
+        if (symbol := subscription["symbol"]) not in self.__books:
+            self.__books[symbol] = self._BOOK(funding=symbol.startswith("f"))
+
+        self.__books[symbol].snapshot(snapshot)
+
+    def __on_update(self, subscription: "Book", data: Any) -> None:
+        if (book := self.__books.get(subscription["symbol"])) is not None:
+            book.update(data)
+
+    def __on_checksum(self, subscription: "Book", checksum: int) -> None:
+        if (book := self.__books.get(symbol := subscription["symbol"])) is not None \
+                and (actual := book.checksum()) != checksum:
+            self.__wss.logger.warning(f"Checksum mismatch on the order book of <{symbol}> (expected: " \
+                f"{checksum}, actual: {actual}), resubscribing to the channel...")
+
+            asyncio.ensure_future(self.__wss.resubscribe(subscription["subId"]))
+
+class OrderBooks(_OrderBooks):
+    """Keeps an OrderBook up to date for every P0-P4 book channel subscription, indexed by symbol."""
+
+    _BOOK = OrderBook
+
+    _SNAPSHOT_EVENTS = ("t_book_snapshot", "f_book_snapshot")
+
+    _UPDATE_EVENTS = ("t_book_update", "f_book_update")
+
+    _CHECKSUM_EVENTS = ("t_book_checksum", "f_book_checksum")
+
+    def __getitem__(self, symbol: str) -> OrderBook:
+        return super().__getitem__(symbol)
+
+class RawOrderBooks(_OrderBooks):
+    """Keeps a RawOrderBook up to date for every R0 book channel subscription, indexed by symbol."""
+
+    _BOOK = RawOrderBook
+
+    _SNAPSHOT_EVENTS = ("t_raw_book_snapshot", "f_raw_book_snapshot")
+
+    _UPDATE_EVENTS = ("t_raw_book_update", "f_raw_book_update")
+
+    _CHECKSUM_EVENTS = ("t_raw_book_checksum", "f_raw_book_checksum")
+
+    def __getitem__(self, symbol: str) -> RawOrderBook:
+        return super().__getitem__(symbol)
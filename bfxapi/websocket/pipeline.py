@@ -0,0 +1,138 @@
+from typing import \
+    TYPE_CHECKING, Deque, Dict, List, Set, Tuple, Hashable, Callable, Awaitable, Optional, Literal, Any
+
+from collections import deque
+
+import asyncio, time
+
+if TYPE_CHECKING:
+    from websockets.legacy.client import WebSocketClientProtocol
+
+__all__ = [
+    "Pipeline"
+]
+
+Policy = Literal["block", "drop", "conflate"]
+
+class _Queue:
+    def __init__(self, maxsize: int, policy: Policy, pipeline: "Pipeline"):
+        self.__maxsize, self.__policy, self.__pipeline = maxsize, policy, pipeline
+
+        self.__items: Deque[Tuple[Optional[Hashable], Optional[Hashable], List[Any]]] = deque()
+
+        self.__keys: Dict[Hashable, List[Any]] = { }
+
+        self.__groups: Dict[Optional[Hashable], Set[Hashable]] = { }
+
+        self.__not_empty, self.__not_full = asyncio.Event(), asyncio.Event()
+
+    async def put(self,
+                  item: Any,
+                  droppable: bool = False,
+                  key: Optional[Hashable] = None,
+                  group: Optional[Hashable] = None) -> None:
+        if key is not None and (cell := self.__keys.get(key)) is not None:
+            cell[0] = item
+
+            self.__pipeline.conflated += 1
+
+            return
+
+        if key is None and group is not None:
+            for _key in self.__groups.pop(group, ()):
+                del self.__keys[_key]
+
+        while len(self.__items) >= self.__maxsize:
+            if droppable and self.__policy == "drop":
+                self.__pipeline.dropped += 1
+
+                return
+
+            self.__not_full.clear()
+
+            await self.__not_full.wait()
+
+        self.__items.append((key, group, cell := [ item ]))
+
+        if key is not None:
+            self.__keys[key] = cell
+
+            self.__groups.setdefault(group, set()).add(key)
+
+        self.__not_empty.set()
+
+    async def get(self) -> Any:
+        while not self.__items:
+            self.__not_empty.clear()
+
+            await self.__not_empty.wait()
+
+        key, group, cell = self.__items.popleft()
+
+        if key is not None and self.__keys.get(key) is cell:
+            del self.__keys[key]
+
+            (keys := self.__groups[group]).discard(key)
+
+            if not keys:
+                del self.__groups[group]
+
+        self.__not_full.set()
+
+        return cell[0]
+
+class Pipeline:
+    """
+    Runs the reading, decoding and dispatching of the messages of a connection as
+    separate tasks, connected by bounded queues, so that slow event handlers do not
+    stop the client from reading from the socket.
+
+    When the queue between decoding and dispatching is full, the policy decides what
+    happens to the next message: "block" waits for some room (i.e. backpressure),
+    "drop" discards it and "conflate" replaces any message still waiting for the
+    same ticker/status/candles channel or book level (with the latest one) before
+    falling back to waiting. Control messages (e.g. subscriptions), snapshots and
+    checksums are never dropped, and updates are never conflated across a snapshot
+    or a checksum of their channel.
+    """
+
+    def __init__(self, maxsize: int = 1024, policy: Policy = "block"):
+        self.maxsize, self.policy = maxsize, policy
+
+        self.dropped, self.conflated = 0, 0
+
+    async def run(self,
+                  websocket: "WebSocketClientProtocol",
+                  decode: Callable[[str, float], Optional[Tuple]],
+                  dispatch: Callable[..., Awaitable[None]],
+                  classify: Callable[[Any], Tuple[bool, Optional[Hashable], Optional[Hashable]]]) -> None:
+        received, decoded = _Queue(self.maxsize, "block", self), _Queue(self.maxsize, self.policy, self)
+
+        conflate = self.policy == "conflate"
+
+        async def _read():
+            async for message in websocket:
+                await received.put((message, time.time()))
+
+            await received.put(None)
+
+        async def _decode():
+            while (message := await received.get()) is not None:
+                if (item := decode(*message)) is not None:
+                    droppable, key, group = classify(item[0])
+
+                    await decoded.put(item, droppable, key if conflate else None, group)
+
+            await decoded.put(None)
+
+        async def _dispatch():
+            while (item := await decoded.get()) is not None:
+                await dispatch(*item)
+
+        tasks = [ asyncio.create_task(coroutine) for coroutine in (_read(), _decode(), _dispatch()) ]
+
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -0,0 +1,68 @@
+from typing import Iterable, Set, Optional
+
+import asyncio, time
+
+__all__ = [
+    "RateLimiter",
+    "Recovery"
+]
+
+class RateLimiter:
+    """
+    Token bucket shared by the buckets of a client: up to <burst> frames can be sent
+    at once, then no more than <rate> frames per second.
+    """
+
+    def __init__(self, rate: float = 10.0, burst: int = 20):
+        self.rate, self.burst = rate, burst
+
+        self.__tokens, self.__updated = float(burst), time.monotonic()
+
+    async def acquire(self) -> None:
+        while True:
+            now = time.monotonic()
+
+            self.__tokens = min(self.burst, self.__tokens + (now - self.__updated) * self.rate)
+
+            self.__updated = now
+
+            if self.__tokens >= 1:
+                self.__tokens -= 1
+
+                return
+
+            await asyncio.sleep((1 - self.__tokens) / self.rate)
+
+class Recovery:
+    """
+    Progress of the resubscription of a bucket to its channels, after a reconnection.
+
+    <duration> is the time (in seconds) between the reconnection and the last
+    acknowledgement (either a subscription or an error) of the server.
+    """
+
+    def __init__(self, sub_ids: Iterable[str]):
+        self.pending: Set[str] = set(sub_ids)
+
+        self.total, self.failed = len(self.pending), 0
+
+        self.started = time.monotonic()
+
+        self.duration: Optional[float] = None
+
+    @property
+    def completed(self) -> bool:
+        return self.duration is not None
+
+    def ack(self, sub_id: str, failed: bool = False) -> bool:
+        if self.completed or sub_id not in self.pending:
+            return False
+
+        self.pending.remove(sub_id)
+
+        self.failed += failed
+
+        if not self.pending:
+            self.duration = time.monotonic() - self.started
+
+        return self.completed
@@ -0,0 +1,97 @@
+from typing import TYPE_CHECKING, Dict, Set, Hashable, Optional, Any
+
+if TYPE_CHECKING:
+    from .client import BfxWebSocketBucket
+
+__all__ = [
+    "SubscriptionRegistry"
+]
+
+class SubscriptionRegistry:
+    """
+    Indexes the subscriptions of all the buckets of a client by subId (to their bucket
+    and chanId) and by stream, i.e. channel and parameters (to their subId).
+
+    A subscription to a stream which is already subscribed (or pending) does not open a
+    new channel: its subId becomes an alias of the existing subscription, which is only
+    unsubscribed once all of its subIds have been unsubscribed.
+    """
+
+    def __init__(self):
+        self.__buckets: Dict[str, "BfxWebSocketBucket"] = { }
+
+        self.__chan_ids: Dict[str, int] = { }
+
+        self.__keys: Dict[Hashable, str] = { }
+
+        self.__streams: Dict[str, Hashable] = { }
+
+        self.__aliases: Dict[str, str] = { }
+
+        self.__references: Dict[str, Set[str]] = { }
+
+    @staticmethod
+    def key(channel: str, conflate: Any = None, **kwargs: Any) -> Hashable:
+        return (channel, conflate, tuple(sorted(kwargs.items())))
+
+    def __len__(self) -> int:
+        return len(self.__buckets)
+
+    def resolve(self, sub_id: str) -> str:
+        return self.__aliases.get(sub_id, sub_id)
+
+    def find(self, key: Hashable) -> Optional[str]:
+        return self.__keys.get(key)
+
+    def released(self, sub_id: str) -> bool:
+        return not self.__references.get(sub_id, True)
+
+    def register(self, sub_id: str, key: Hashable, bucket: "BfxWebSocketBucket") -> None:
+        self.__buckets[sub_id] = bucket
+
+        if sub_id not in self.__streams:
+            self.__keys[key], self.__streams[sub_id], self.__references[sub_id] = sub_id, key, { sub_id }
+
+    def alias(self, sub_id: str, alias: str) -> None:
+        self.__aliases[alias] = sub_id
+
+        self.__references[sub_id].add(alias)
+
+    def bind(self, sub_id: str, chan_id: int) -> None:
+        self.__chan_ids[sub_id] = chan_id
+
+    def unbind(self, sub_id: str) -> None:
+        self.__chan_ids.pop(sub_id, None)
+
+    def release(self, sub_id: str) -> Optional[str]:
+        if sub_id not in (references := self.__references.get(canonical := self.resolve(sub_id), set())):
+            return None
+
+        references.remove(sub_id)
+
+        self.__aliases.pop(sub_id, None)
+
+        if references:
+            return None
+
+        if self.__keys.get(key := self.__streams[canonical]) == canonical:
+            del self.__keys[key]
+
+        return canonical
+
+    def unregister(self, sub_id: str) -> None:
+        self.__buckets.pop(sub_id, None)
+
+        self.__chan_ids.pop(sub_id, None)
+
+        if (key := self.__streams.pop(sub_id, None)) is not None and self.__keys.get(key) == sub_id:
+            del self.__keys[key]
+
+        for alias in self.__references.pop(sub_id, ()):
+            self.__aliases.pop(alias, None)
+
+    def get_bucket(self, sub_id: str) -> Optional["BfxWebSocketBucket"]:
+        return self.__buckets.get(self.resolve(sub_id))
+
+    def get_chan_id(self, sub_id: str) -> Optional[int]:
+        return self.__chan_ids.get(self.resolve(sub_id))
@@ -0,0 +1,203 @@
+from typing import TYPE_CHECKING, NamedTuple, Dict, List, Set, Tuple, Callable, Optional, Any
+
+from dataclasses import fields
+
+from enum import Enum, IntFlag
+
+from multiprocessing import resource_tracker
+
+from multiprocessing.shared_memory import SharedMemory
+
+from operator import attrgetter
+
+import os, sys, struct
+
+if TYPE_CHECKING:
+    from .client import BfxWebSocketClient
+
+__all__ = [
+    "RecordKind",
+    "RecordFlag",
+    "Record",
+    "RingBufferWriter",
+    "RingBufferReader"
+]
+
+_HEADER = struct.Struct("<QQQ")
+
+_HEADER_SIZE = 64
+
+_SEQUENCE = struct.Struct("<Q")
+
+_MAXIMUM_VALUES, _MAXIMUM_SYMBOL_LENGTH = 14, 45
+
+_RECORD = struct.Struct(f"<QBBB{_MAXIMUM_SYMBOL_LENGTH}s{_MAXIMUM_VALUES}d")
+
+class RecordKind(int, Enum):
+    TICKER = 1
+    TRADE = 2
+    BOOK = 3
+    RAW_BOOK = 4
+    CANDLE = 5
+
+class RecordFlag(IntFlag):
+    SNAPSHOT = 1
+    RESET = 2
+
+class Record(NamedTuple):
+    kind: RecordKind
+    symbol: str
+    values: Tuple[float, ...]
+    flags: RecordFlag = RecordFlag(0)
+
+_CREATED: Set[str] = set()
+
+def _attach(name: str) -> SharedMemory:
+    if sys.version_info >= (3, 13):
+        #pylint: disable-next=unexpected-keyword-arg
+        return SharedMemory(name=name, track=False)
+
+    memory = SharedMemory(name=name)
+
+    # Before Python 3.13, the resource tracker of any process which attaches to a segment
+    # unlinks it when the process exits, unless the segment was created by that process.
+    if os.name == "posix" and memory.name not in _CREATED:
+        #pylint: disable-next=protected-access
+        resource_tracker.unregister(memory._name, "shared_memory") # type: ignore[attr-defined]
+
+    return memory
+
+class RingBufferWriter:
+    """
+    Writes the market data events of a BfxWebSocketClient into a ring buffer of
+    fixed-width records, allocated in shared memory, for other local processes
+    (see RingBufferReader) to read.
+
+    Each record holds the symbol (or candles key, up to 45 bytes) of its subscription and
+    up to 14 values, i.e. the fields of the parsed event in declaration order (None becomes
+    NaN). The rows of a snapshot are flagged with SNAPSHOT, and preceded by a RESET record
+    (without values), after which readers should discard what they know of the symbol.
+    """
+
+    EVENTS: Dict[str, RecordKind] = {
+        "t_ticker_update": RecordKind.TICKER, "f_ticker_update": RecordKind.TICKER,
+        "t_trade_execution": RecordKind.TRADE, "f_trade_execution": RecordKind.TRADE,
+        "t_book_update": RecordKind.BOOK, "f_book_update": RecordKind.BOOK,
+        "t_raw_book_update": RecordKind.RAW_BOOK, "f_raw_book_update": RecordKind.RAW_BOOK,
+        "candles_update": RecordKind.CANDLE
+    }
+
+    SNAPSHOT_EVENTS: Dict[str, RecordKind] = {
+        "t_trades_snapshot": RecordKind.TRADE, "f_trades_snapshot": RecordKind.TRADE,
+        "t_book_snapshot": RecordKind.BOOK, "f_book_snapshot": RecordKind.BOOK,
+        "t_raw_book_snapshot": RecordKind.RAW_BOOK, "f_raw_book_snapshot": RecordKind.RAW_BOOK,
+        "candles_snapshot": RecordKind.CANDLE
+    }
+
+    def __init__(self, name: Optional[str] = None, capacity: int = 65_536):
+        self.capacity = capacity
+
+        self.__memory = SharedMemory(name=name, create=True, size=_HEADER_SIZE + capacity * _RECORD.size)
+
+        self.name, self.__buffer, self.__index = self.__memory.name, self.__memory.buf, 0
+
+        _CREATED.add(self.name)
+
+        self.__getters: Dict[type, Callable[[Any], Tuple]] = { }
+
+        _HEADER.pack_into(self.__buffer, 0, capacity, _RECORD.size, 0)
+
+    def attach(self, wss: "BfxWebSocketClient") -> None:
+        for event, kind in RingBufferWriter.EVENTS.items():
+            wss.on(event, callback=self.__listener(kind, False))
+
+        for event, kind in RingBufferWriter.SNAPSHOT_EVENTS.items():
+            wss.on(event, callback=self.__listener(kind, True))
+
+    def __listener(self, kind: RecordKind, snapshot: bool) -> Callable[[Dict[str, Any], Any], None]:
+        def _listener(subscription: Dict[str, Any], data: Any) -> None:
+            symbol = subscription.get("symbol") or subscription["key"]
+
+            if not snapshot:
+                return self.write(kind, symbol, self.__values(data))
+
+            self.write(kind, symbol, (), RecordFlag.RESET)
+
+            for item in data:
+                self.write(kind, symbol, self.__values(item), RecordFlag.SNAPSHOT)
+
+            return None
+
+        return _listener
+
+    def __values(self, item: Any) -> Tuple:
+        if (getter := self.__getters.get(klass := type(item))) is None:
+            getter = self.__getters[klass] = attrgetter(*[ field.name for field in fields(klass) ])
+
+        return getter(item)
+
+    def write(self, kind: RecordKind, symbol: str, values: Tuple, flags: RecordFlag = RecordFlag(0)) -> None:
+        if len(encoded := symbol.encode("utf8")) > _MAXIMUM_SYMBOL_LENGTH:
+            raise ValueError(f"Symbol <{symbol}> is longer than {_MAXIMUM_SYMBOL_LENGTH} bytes.")
+
+        offset = _HEADER_SIZE + (self.__index % self.capacity) * _RECORD.size
+
+        values = tuple(float("nan") if value is None else value for value in values[:_MAXIMUM_VALUES])
+
+        _RECORD.pack_into(self.__buffer, offset, 0, kind, len(values), flags, encoded,
+            *values, *([ 0.0 ] * (_MAXIMUM_VALUES - len(values))))
+
+        self.__index += 1
+
+        _SEQUENCE.pack_into(self.__buffer, offset, self.__index)
+
+        _SEQUENCE.pack_into(self.__buffer, 16, self.__index)
+
+    def close(self) -> None:
+        self.__memory.close()
+
+        self.__memory.unlink()
+
+        _CREATED.discard(self.name)
+
+class RingBufferReader:
+    """
+    Reads the records written by a RingBufferWriter, from the moment the reader is created.
+
+    A reader slower than the writer loses the oldest records, which are counted in <lost>.
+    """
+
+    def __init__(self, name: str):
+        self.__memory = _attach(name)
+
+        self.__buffer = self.__memory.buf
+
+        self.capacity, _, self.__index = _HEADER.unpack_from(self.__buffer, 0)
+
+        self.lost = 0
+
+    def read(self, limit: Optional[int] = None) -> List[Record]:
+        records: List[Record] = [ ]
+
+        if (written := _SEQUENCE.unpack_from(self.__buffer, 16)[0]) - self.__index > self.capacity:
+            self.lost, self.__index = self.lost + written - self.capacity - self.__index, written - self.capacity
+
+        if limit is not None:
+            written = min(written, self.__index + limit)
+
+        while self.__index < written:
+            offset = _HEADER_SIZE + (self.__index % self.capacity) * _RECORD.size
+
+            sequence, kind, count, flags, symbol, *values = _RECORD.unpack_from(self.__buffer, offset)
+
+            self.__index += 1
+
+            if sequence != self.__index or _SEQUENCE.unpack_from(self.__buffer, offset)[0] != sequence:
+                self.lost += 1
+            else: records.append(Record(RecordKind(kind), symbol.rstrip(b"\0").decode("utf8"),
+                tuple(values[:count]), RecordFlag(flags)))
+
+        return records
+
+    def close(self) -> None:
+        self.__memory.close()